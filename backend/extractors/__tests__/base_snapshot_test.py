@@ -13,6 +13,7 @@ Usage:
         test_cases = ["790312551421"]
 """
 
+import asyncio
 import json
 import pytest
 from pathlib import Path
@@ -115,6 +116,14 @@ class BaseExtractorSnapshotTest(ABC):
             assert result.get('description'), \
                 f"Description should not be empty for {self.company}:{external_id}"
 
+    def test_extract_many_matches_serial(self, extractor):
+        """Verify concurrent extract_many() returns the same results, in order."""
+        raw_contents = [self.load_fixture(external_id) for external_id in self.test_cases]
+
+        results = asyncio.run(extractor.extract_many(raw_contents))
+
+        assert results == [extractor.extract_raw_info(raw) for raw in raw_contents]
+
 
 def generate_expected_output(extractor_class: Type[BaseJobExtractor],
                               company: str,
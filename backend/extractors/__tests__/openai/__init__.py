@@ -0,0 +1 @@
+# OpenAI extractor tests
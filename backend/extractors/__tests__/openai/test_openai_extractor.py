@@ -0,0 +1,16 @@
+"""
+OpenAI extractor snapshot tests.
+
+Tests extract_raw_info() against stored HTML fixtures.
+"""
+
+from extractors.openai import OpenAIExtractor
+from extractors.__tests__.base_snapshot_test import BaseExtractorSnapshotTest
+
+
+class TestOpenAIExtractor(BaseExtractorSnapshotTest):
+    """Snapshot tests for OpenAI (Ashby) job extractor."""
+
+    extractor_class = OpenAIExtractor
+    company = "openai"
+    test_cases = ["0f1e2d3c-4b5a-4697-8877-a1b2c3d4e5f6", "7a6b5c4d-3e2f-4a1b-9c8d-e7f6a5b4c3d2"]
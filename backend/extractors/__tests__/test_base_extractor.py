@@ -0,0 +1,275 @@
+"""
+Unit tests for BaseJobExtractor's generic Stage 1 logic.
+
+Uses a stub extractor with canned jobs - no network calls.
+
+Run: python3 -m pytest extractors/__tests__/test_base_extractor.py -v
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from extractors.base_extractor import BaseJobExtractor, find_json_ld
+from extractors.config import BATCH_SCAN_THRESHOLD, TitleFilters
+from extractors.enums import Company
+
+
+class StubExtractor(BaseJobExtractor[TitleFilters]):
+    """Extractor returning a fixed job list."""
+
+    COMPANY_NAME = Company.GOOGLE
+    API_URL = "https://example.com/api"
+    URL_PREFIX_JOB = "https://example.com/jobs"
+
+    JOBS = [
+        {'id': '1', 'title': 'Software Engineer', 'location': 'NYC', 'response_data': {}},
+        {'id': '2', 'title': 'Senior Staff Engineer', 'location': 'SF', 'response_data': {}},
+        {'id': '3', 'title': 'Software Engineer Intern', 'location': 'LA', 'response_data': {}},
+        {'id': '', 'title': 'Engineer', 'location': '', 'response_data': {}},
+    ]
+
+    async def _fetch_all_jobs(self):
+        return list(self.JOBS)
+
+    def extract_raw_info(self, raw_content: str) -> dict:
+        return {'description': raw_content, 'requirements': ''}
+
+
+def run_metadata(config: TitleFilters) -> dict:
+    return asyncio.run(StubExtractor(config=config).extract_source_urls_metadata())
+
+
+class TestExtractSourceUrlsMetadata:
+    """Filtering partitions jobs and builds metadata for both sides."""
+
+    def test_no_filters_includes_all(self):
+        result = run_metadata(TitleFilters())
+
+        assert result['total_count'] == 4
+        assert result['filtered_count'] == 0
+        # Job without id has no buildable URL
+        assert result['urls_count'] == 3
+        assert [j['id'] for j in result['included_jobs']] == ['1', '2', '3']
+
+    def test_exclude_partitions_jobs(self):
+        result = run_metadata(TitleFilters(exclude=['senior staff', 'INTERN']))
+
+        assert result['filtered_count'] == 2
+        assert [j['id'] for j in result['included_jobs']] == ['1']
+        assert result['excluded_jobs'] == [
+            {'id': '2', 'title': 'Senior Staff Engineer', 'location': 'SF',
+             'url': 'https://example.com/jobs/2'},
+            {'id': '3', 'title': 'Software Engineer Intern', 'location': 'LA',
+             'url': 'https://example.com/jobs/3'},
+        ]
+
+    def test_include_is_or_logic(self):
+        result = run_metadata(TitleFilters(include=['intern', 'senior']))
+
+        assert [j['id'] for j in result['included_jobs']] == ['2', '3']
+
+
+class TestBuildUrlFromJob:
+    """URL building dispatches on URL_BUILDER_KEY."""
+
+    def build(self, key: str, job: dict) -> str:
+        extractor = StubExtractor(config=TitleFilters())
+        extractor.URL_BUILDER_KEY = key
+        return extractor._build_url_from_job(job)
+
+    def test_id(self):
+        assert self.build('id', {'id': '7', 'response_data': {'url': 'x'}}) == 'https://example.com/jobs/7'
+        assert self.build('id', {'id': '', 'response_data': {}}) == ''
+
+    def test_response_data_url(self):
+        job = {'id': '7', 'response_data': {'url': 'https://other.com/7'}}
+
+        assert self.build('url', job) == 'https://other.com/7'
+        assert self.build('absolute_url', job) == ''
+
+    def test_job_path(self):
+        job = {'id': '7', 'response_data': {'job_path': '/en/jobs/7/swe'}}
+
+        assert self.build('job_path', job) == 'https://example.com/jobs/en/jobs/7/swe'
+        assert self.build('job_path', {'id': '7', 'response_data': None}) == ''
+
+
+class TestFilterByTitle:
+    """Case-insensitive substring matching via compiled alternations."""
+
+    def test_docstring_example(self):
+        extractor = StubExtractor(config=TitleFilters())
+        titles = ["Software Engineer", "Senior Staff Engineer", "Intern"]
+
+        assert extractor.filter_by_title(titles, None, ["senior staff", "intern"]) == [True, False, False]
+
+    def test_terms_are_literal_not_regex(self):
+        filters = TitleFilters(include=['c++'], exclude=['(contract)'])
+
+        assert filters.matches('C++ Engineer')
+        assert not filters.matches('C++ Engineer (Contract)')
+        assert not filters.matches('Cxx Engineer')
+
+    def test_empty_include_list_matches_nothing(self):
+        assert not TitleFilters(include=[]).matches('Software Engineer')
+        assert not TitleFilters().matches('')
+
+    def test_matcher_is_shared_across_identical_filters(self):
+        first = TitleFilters(include=['engineer'], exclude=['intern'])
+        second = TitleFilters.from_dict({'include': ['engineer'], 'exclude': ['intern']})
+
+        assert first.matcher is second.matcher
+        assert first.matcher is not TitleFilters(exclude=['intern']).matcher
+
+    def test_large_batch_matches_per_title_matcher(self):
+        extractor = StubExtractor(config=TitleFilters())
+        titles = ["Software Engineer", "Senior Staff Engineer", "Intern", "", "C++ Dev"] * 200
+        exclude = [f"term{i}" for i in range(20)] + ["senior staff", "INTERN"]
+        include = ["engineer", "c++"]
+        expected = [TitleFilters(include=include, exclude=exclude).matches(t) for t in titles]
+
+        assert len(titles) * len(exclude) > BATCH_SCAN_THRESHOLD
+        assert extractor.filter_by_title(titles, include, exclude) == expected
+        assert expected[:5] == [True, False, False, False, True]
+
+
+class TestCrawlMany:
+    """Job-page fetches are gated by the crawl semaphore."""
+
+    def test_concurrency_is_bounded(self):
+        extractor = StubExtractor(config=TitleFilters())
+        extractor._crawl_sem = asyncio.Semaphore(2)
+        in_flight = peak = 0
+
+        class Response:
+            def __init__(self, url):
+                self.text = f"page {url}"
+
+        async def fake_request(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Response(url)
+
+        extractor.make_request = fake_request
+        urls = [f"https://example.com/jobs/{i}" for i in range(6)]
+
+        pages = asyncio.run(extractor.crawl_many(urls))
+
+        assert pages == [f"page {url}" for url in urls]
+        assert peak == 2
+
+
+class TestMakeRequestThrottle:
+    """Throttled responses back off per host and are retried."""
+
+    def run(self, statuses, headers=None, stream=False):
+        extractor = StubExtractor(config=TitleFilters())
+        extractor.THROTTLE_BASE_DELAY = 0.001
+        extractor.THROTTLE_RETRIES = 2
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.host)
+            return httpx.Response(statuses[len(calls) - 1], headers=headers)
+
+        async def request():
+            async with extractor:
+                extractor._client._transport = httpx.MockTransport(handler)
+                try:
+                    if stream:
+                        async with extractor.stream_request("https://example.com/api") as response:
+                            return response.status_code
+                    return (await extractor.make_request("https://example.com/api")).status_code
+                except httpx.HTTPStatusError as e:
+                    return e.response.status_code
+
+        return asyncio.run(request()), calls, extractor._host_delays
+
+    def test_retries_until_success(self):
+        status, calls, delays = self.run([429, 429, 200])
+
+        assert status == 200
+        assert len(calls) == 3
+        # Base step, doubled once, then halved on success
+        assert delays['example.com'] == 0.001
+
+    def test_gives_up_after_retries(self):
+        status, calls, delays = self.run([429, 429, 429])
+
+        assert status == 429
+        assert len(calls) == 3
+        assert delays['example.com'] == 0.004
+
+    def test_forbidden_is_not_retried(self):
+        status, calls, delays = self.run([403, 200])
+
+        assert status == 403
+        assert len(calls) == 1
+        assert delays['example.com'] == 0.0
+
+    def test_forbidden_with_retry_after_is_retried(self):
+        status, calls, _ = self.run([403, 200], headers={'Retry-After': '0'})
+
+        assert status == 200
+        assert len(calls) == 2
+
+    def test_stream_request_is_throttled(self):
+        status, calls, _ = self.run([429, 200], stream=True)
+
+        assert status == 200
+        assert len(calls) == 2
+
+
+class TestRequiredClassVariables:
+    """Missing class variables fail at class definition."""
+
+    def test_missing_url_prefix_raises(self):
+        with pytest.raises(NotImplementedError, match="URL_PREFIX_JOB"):
+            class MissingPrefix(BaseJobExtractor[TitleFilters]):
+                COMPANY_NAME = Company.GOOGLE
+                API_URL = "https://example.com/api"
+
+
+class TestFindJsonLd:
+    """JSON-LD blocks are located with str.find and parsed with orjson."""
+
+    def test_returns_matching_type(self):
+        text = (
+            '<script type="application/ld+json">{"@type": "WebSite"}</script>'
+            '<script type="application/ld+json">'
+            '{"@type": "JobPosting", "description": "<p>Say \\"hi\\"</p>\\n\\ud83d\\ude00"}'
+            '</script>'
+        )
+
+        assert find_json_ld(text)['description'] == '<p>Say "hi"</p>\n\U0001f600'
+
+    def test_skips_invalid_blocks(self):
+        text = (
+            '<script type="application/ld+json">{not json</script>'
+            '<script type=\'application/ld+json\'>[{"@type": "JobPosting", "title": "SWE"}]</script>'
+        )
+
+        assert find_json_ld(text) == {'@type': 'JobPosting', 'title': 'SWE'}
+
+    def test_missing(self):
+        assert find_json_ld('<script>{"@type": "JobPosting"}</script>') is None
+        assert find_json_ld('<script type="application/ld+json">{"@type": "JobPosting"}') is None
+
+    def test_type_list_and_graph(self):
+        text = (
+            '<script type="application/ld+json">'
+            '{"@graph": [{"@type": "Organization"}, {"@type": ["JobPosting"], "title": "SWE"}]}'
+            '</script>'
+        )
+
+        assert find_json_ld(text) == {'@type': ['JobPosting'], 'title': 'SWE'}
+
+    def test_raw_control_characters(self):
+        text = '<script type="application/ld+json">{"@type": "JobPosting", "description": "a\tb\nc"}</script>'
+
+        assert find_json_ld(text)['description'] == 'a\tb\nc'
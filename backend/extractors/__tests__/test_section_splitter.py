@@ -0,0 +1,71 @@
+"""
+Unit tests for SectionSplitter (shared Netflix/OpenAI description splitting).
+
+Run: python3 -m pytest extractors/__tests__/test_section_splitter.py -v
+"""
+
+from extractors.section_splitter import SectionSplitter, strip_html
+
+HEADER_OPEN = r'<(?:strong|b)[^>]*>'
+REQ = (r'\s*Requirements?:?\s*</(?:strong|b)>', r'\s*Qualifications:?\s*</(?:strong|b)>')
+NICE = (r'\s*Nice to have:?\s*</(?:strong|b)>',)
+END = (r'\s*About us\s*</(?:strong|b)>',)
+
+DESC = (
+    '<p>Build things.</p>'
+    '<strong>Qualifications:</strong><ul><li>Python</li></ul>'
+    '<b>Nice to have</b><ul><li>Go</li></ul>'
+    '<strong>About us</strong><p>We ship.</p>'
+    '<strong>Requirements</strong><ul><li>Rust</li></ul>'
+)
+
+
+def splitters(**kwargs):
+    """The same markers as per-pattern searches and as one alternation"""
+    per_pattern = SectionSplitter(
+        [HEADER_OPEN + p for p in REQ], [HEADER_OPEN + p for p in NICE],
+        [HEADER_OPEN + p for p in END], **kwargs
+    )
+    single_scan = SectionSplitter(REQ, NICE, END, header_open=HEADER_OPEN, **kwargs)
+    return per_pattern, single_scan
+
+
+class TestSectionSplitter:
+    """Split points follow pattern priority, then position."""
+
+    def test_priority_wins_over_position(self):
+        for splitter in splitters():
+            result = splitter.split(DESC)
+
+            # 'Requirements' is listed first, so it wins despite appearing last
+            assert result['description'].startswith('Build things.\nQualifications:')
+            assert result['requirements'] == 'Requirements \n- Rust'
+
+    def test_required_and_preferred_with_tail(self):
+        desc = DESC.rsplit('<strong>Requirements', 1)[0]
+
+        for splitter in splitters():
+            assert splitter.split(desc) == {
+                'description': 'Build things.\n\nAbout us \nWe ship.',
+                'requirements': 'Required:\nQualifications: \n- Python\n\nPreferred:\nNice to have \n- Go',
+            }
+
+    def test_tail_dropped(self):
+        desc = DESC.rsplit('<strong>Requirements', 1)[0]
+
+        for splitter in splitters(keep_tail=False):
+            assert splitter.split(desc)['description'] == 'Build things.'
+
+    def test_no_requirements_section(self):
+        for splitter in splitters():
+            assert splitter.split('<p>Just a &amp; description</p>') == {
+                'description': 'Just a & description',
+                'requirements': '',
+            }
+
+    def test_strip_html_lists(self):
+        assert strip_html('<ul><li><p>One</p></li><li>Two</li></ul>') == '- One\n- Two'
+
+    def test_strip_html_stray_angle_bracket(self):
+        # A '<' that never closes is kept as text; the tag after it still goes
+        assert strip_html('<p>Pay < 100k <b>USD</b></p>') == 'Pay < 100k USD'
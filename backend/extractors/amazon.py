@@ -27,10 +27,13 @@ Sample API Response:
 """
 
 from typing import List, Dict, Any
+import logging
 from .base_extractor import BaseJobExtractor
 from .config import TitleFilters
 from .enums import Company
 
+logger = logging.getLogger(__name__)
+
 
 class AmazonExtractor(BaseJobExtractor[TitleFilters]):
     """
@@ -44,18 +47,18 @@ class AmazonExtractor(BaseJobExtractor[TitleFilters]):
 
     API_URL = "https://amazon.jobs/en/search.json"
     URL_PREFIX_JOB = "https://amazon.jobs"
+    URL_BUILDER_KEY = 'job_path'  # URL_PREFIX_JOB + response_data job_path
+
+    # Amazon-specific headers
+    DEFAULT_HEADERS = {
+        'Accept': 'application/json, text/plain, */*',
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
+    }
 
     def __init__(self, config):
         """Initialize Amazon extractor"""
         super().__init__(config)
 
-    def get_headers(self) -> Dict[str, str]:
-        """Override with Amazon-specific headers"""
-        return {
-            'Accept': 'application/json, text/plain, */*',
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
-        }
-
     def _build_params(self, offset: int, result_limit: int) -> Dict[str, Any]:
         """
         Build query parameters
@@ -99,13 +102,13 @@ class AmazonExtractor(BaseJobExtractor[TitleFilters]):
                 timeout=10.0
             )
 
-            data = response.json()
+            data = self._parse_json(response)
             jobs = data.get('jobs', [])
             total = data.get('hits', 0)
             return jobs, total
 
-        except Exception as e:
-            print(f"Error fetching Amazon jobs: {e}")
+        except Exception:
+            logger.exception("Error fetching Amazon jobs")
             return [], 0
 
     async def _fetch_all_jobs(self) -> List[Dict[str, Any]]:
@@ -189,7 +192,7 @@ class AmazonExtractor(BaseJobExtractor[TitleFilters]):
         def strip_html(html: str) -> str:
             """Strip HTML tags and normalize whitespace"""
             text = re.sub(r'<br\s*/?>', '\n', html)  # Convert <br> to newline
-            text = re.sub(r'<[^>]+>', ' ', text)  # Strip other tags
+            text = re.sub(r'<[^<>]++>', ' ', text)  # Strip other tags
             text = re.sub(r'&amp;', '&', text)  # Decode &amp;
             text = re.sub(r'&lt;', '<', text)
             text = re.sub(r'&gt;', '>', text)
@@ -28,13 +28,49 @@ Sample RSC Data Structure:
 }
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import re
 import json
+import logging
 from .base_extractor import BaseJobExtractor
 from .config import TitleFilters
 from .enums import Company
 
+logger = logging.getLogger(__name__)
+
+# Office objects in the RSC payload look like {"id":123,"name":"...","departments":[...]}
+_OFFICE_ANCHOR = '","departments":['
+_NAME_KEY = ',"name":"'
+_ID_KEY = '"id":'
+_OFFICE_HEADER_SCAN = 256  # Max chars to walk back from the anchor for the office header
+
+# Job page section headers, matched at the start of h2/h3 header text
+_SECTION_HEADERS = (
+    'About the role',
+    'Responsibilities',
+    "What You'll Work On",
+    'You may be a good fit',
+    'You might be a great fit',
+    'Strong candidates',
+    'Bonus points',
+)
+# Header layouts tried in order: h2/h3 with <strong> wrapper, then plain h2/h3.
+# {} is the header text; content runs until the next h2/h3 or end of document.
+_SECTION_LAYOUTS = (
+    r'<h2[^>]*>\s*<strong>{}[^<]*</strong>\s*</h2>(.*?)(?=<h[23]|$)',
+    r'<h3[^>]*>\s*<strong>{}[^<]*</strong>\s*</h3>(.*?)(?=<h[23]|$)',
+    r'<h2[^>]*>{}[^<]*</h2>(.*?)(?=<h[23]|$)',
+    r'<h3[^>]*>{}[^<]*</h3>(.*?)(?=<h[23]|$)',
+)
+# Compiled once at import: header -> patterns in layout order
+_SECTION_RES = {
+    header: tuple(
+        re.compile(layout.format(re.escape(header)), re.DOTALL | re.IGNORECASE)
+        for layout in _SECTION_LAYOUTS
+    )
+    for header in _SECTION_HEADERS
+}
+
 
 class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
     """
@@ -51,6 +87,7 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
 
     API_URL = "https://www.anthropic.com/careers/jobs"
     URL_PREFIX_JOB = "https://boards.greenhouse.io/anthropic/jobs"  # Not used, URLs come from API
+    URL_BUILDER_KEY = 'url'  # Greenhouse absolute_url, stored as response_data url
 
     def __init__(self, config):
         """Initialize Anthropic extractor"""
@@ -113,49 +150,39 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
             }
         """
         offices = []
+        decoder = json.JSONDecoder()
+
+        # Find all office objects by their literal '","departments":[' anchor,
+        # then walk back a bounded distance to validate the "id"/"name" header
+        pos = 0
+        while True:
+            hit = rsc_data.find(_OFFICE_ANCHOR, pos)
+            if hit < 0:
+                break
+            pos = hit + len(_OFFICE_ANCHOR)
+
+            # "name":"<office name>" ends right at the anchor
+            name_pos = rsc_data.rfind(_NAME_KEY, max(0, hit - _OFFICE_HEADER_SCAN), hit)
+            if name_pos < 0 or '"' in rsc_data[name_pos + len(_NAME_KEY):hit]:
+                continue
 
-        # Find all office objects
-        pattern = r'"id":(\d+),"name":"([^"]+)","departments":\['
-        matches = list(re.finditer(pattern, rsc_data))
-
-        for i, match in enumerate(matches):
-            office_id = int(match.group(1))
-            office_name = match.group(2)
-
-            # Find start of this office's JSON
-            start_pos = match.start() - 1
-            while start_pos > 0 and rsc_data[start_pos] != '{':
-                start_pos -= 1
-
-            # Find end using bracket matching
-            if i < len(matches) - 1:
-                next_office_start = matches[i+1].start() - 1
-                while next_office_start > 0 and rsc_data[next_office_start] != '{':
-                    next_office_start -= 1
-                end_pos = next_office_start
-            else:
-                end_pos = len(rsc_data)
-
-            office_chunk = rsc_data[start_pos:end_pos]
-
-            # Use bracket matching to find exact end
-            depth = 0
-            actual_end = 0
-            for j, char in enumerate(office_chunk):
-                if char in '{[':
-                    depth += 1
-                elif char in '}]':
-                    depth -= 1
-                    if depth == 0:
-                        actual_end = j + 1
-                        break
-
-            office_json = office_chunk[:actual_end]
+            # "id":<digits> precedes the name
+            id_end = name_pos
+            id_start = id_end
+            while id_start > 0 and rsc_data[id_start - 1].isdigit():
+                id_start -= 1
+            if id_start == id_end or not rsc_data.startswith(_ID_KEY, id_start - len(_ID_KEY)):
+                continue
+
+            # Find start of this office's JSON and decode exactly one object
+            start_pos = rsc_data.rfind('{', 0, id_start - len(_ID_KEY))
+            if start_pos < 0:
+                continue
 
             try:
-                office_obj = json.loads(office_json)
+                office_obj, _ = decoder.raw_decode(rsc_data, start_pos)
                 offices.append(office_obj)
-            except:
+            except ValueError:
                 continue
 
         return offices
@@ -166,7 +193,7 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
         team_ids: List[int] = None,
         office_ids: List[int] = None,
         unique_titles: bool = True
-    ) -> List[Dict]:
+    ) -> Tuple[List[int], List[str], List[str], List[str], List[int]]:
         """
         Filter jobs by team and office
 
@@ -177,15 +204,20 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
             unique_titles: If True, deduplicate by job ID (same job in multiple locations)
 
         Returns:
-            List of job objects with 'id', 'title', 'url', 'office', 'department'
+            Parallel lists (ids, titles, urls, offices, dept_ids) - index i of
+            each list describes the same job
 
         Note: When the same job ID appears in multiple offices, locations are
               concatenated (e.g., "San Francisco, CA; New York City, NY")
         """
-        from collections import defaultdict
+        ids: List[int] = []
+        titles: List[str] = []
+        urls: List[str] = []
+        job_offices: List[List[str]] = []
+        dept_ids: List[int] = []
 
-        # Collect all job entries (may have duplicates across offices)
-        all_job_entries = []
+        # Job ID -> index into the parallel lists (for deduplication)
+        id_to_idx: Dict[int, int] = {}
 
         for office in offices:
             office_id = office['id']
@@ -197,49 +229,29 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
 
             for dept in office.get('departments', []):
                 dept_id = dept.get('id')
-                dept_name = dept.get('name')
 
                 # Filter by team
                 if team_ids and dept_id not in team_ids:
                     continue
 
                 for job in dept.get('jobs', []):
-                    all_job_entries.append({
-                        'id': job.get('id'),
-                        'title': job.get('title'),
-                        'url': job.get('absolute_url'),
-                        'office': office_name,
-                        'office_id': office_id,
-                        'department': dept_name,
-                        'department_id': dept_id
-                    })
-
-        # Deduplicate by job ID and aggregate locations
-        if unique_titles:
-            jobs_by_id = defaultdict(list)
-            for entry in all_job_entries:
-                jobs_by_id[entry['id']].append(entry)
-
-            results = []
-            for job_id, entries in jobs_by_id.items():
-                # Use first entry as base
-                job = entries[0].copy()
-
-                # If job appears in multiple locations, concatenate them
-                if len(entries) > 1:
-                    unique_offices = []
-                    seen = set()
-                    for entry in entries:
-                        if entry['office'] not in seen:
-                            unique_offices.append(entry['office'])
-                            seen.add(entry['office'])
-                    job['office'] = '; '.join(unique_offices)
-
-                results.append(job)
-        else:
-            results = all_job_entries
-
-        return results
+                    job_id = job.get('id')
+
+                    # Same job in another office: aggregate location only
+                    if unique_titles and job_id in id_to_idx:
+                        names = job_offices[id_to_idx[job_id]]
+                        if office_name not in names:
+                            names.append(office_name)
+                        continue
+
+                    id_to_idx[job_id] = len(ids)
+                    ids.append(job_id)
+                    titles.append(job.get('title'))
+                    urls.append(job.get('absolute_url'))
+                    job_offices.append([office_name])
+                    dept_ids.append(dept_id)
+
+        return ids, titles, urls, ['; '.join(names) for names in job_offices], dept_ids
 
     async def _fetch_all_jobs(self) -> List[Dict[str, Any]]:
         """
@@ -250,7 +262,7 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
             {
                 'id': str,
                 'title': str,
-                'response_data': dict  # Contains absolute_url, office, department, etc.
+                'response_data': dict  # Contains url (absolute_url), office, department_id
             }
         """
         # Hardcoded filters for Anthropic
@@ -268,33 +280,39 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
             # Extract RSC payload
             rsc_data = self._extract_rsc_payload(response.text)
             if not rsc_data:
-                print("Could not extract RSC payload from Anthropic page")
+                logger.warning("Could not extract RSC payload from Anthropic page")
                 return []
 
             # Parse offices
             offices = self._parse_offices(rsc_data)
             if not offices:
-                print("Could not parse offices from RSC data")
+                logger.warning("Could not parse offices from RSC data")
                 return []
 
             # Filter jobs by team and office (client-side filtering)
-            jobs = self._filter_jobs(offices, TEAM_IDS, OFFICE_IDS, UNIQUE_TITLES)
-
-            # Convert to standardized format
-            standardized_jobs = []
-            for job in jobs:
-                standardized_job = {
-                    'id': str(job.get('id', '')),
-                    'title': job.get('title', ''),
-                    'location': job.get('office', ''),  # Anthropic uses 'office' field for location
-                    'response_data': job  # Contains absolute_url, office, department, etc.
-                }
-                standardized_jobs.append(standardized_job)
+            ids, titles, urls, job_offices, dept_ids = self._filter_jobs(
+                offices, TEAM_IDS, OFFICE_IDS, UNIQUE_TITLES
+            )
 
-            return standardized_jobs
+            # Convert to standardized format in a single pass over the columns
+            return [
+                {
+                    'id': str(job_id),
+                    'title': title,
+                    'location': office,  # Anthropic uses 'office' field for location
+                    'response_data': {  # Contains url (absolute_url), office, department_id
+                        'id': job_id,
+                        'title': title,
+                        'url': url,
+                        'office': office,
+                        'department_id': dept_id,
+                    }
+                }
+                for job_id, title, url, office, dept_id in zip(ids, titles, urls, job_offices, dept_ids)
+            ]
 
-        except Exception as e:
-            print(f"Error extracting Anthropic jobs: {e}")
+        except Exception:
+            logger.exception("Error extracting Anthropic jobs")
             return []
 
     def extract_raw_info(self, raw_content: str) -> dict:
@@ -323,7 +341,7 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
             """Strip HTML tags and normalize whitespace"""
             text = re.sub(r'<br\s*/?>', '\n', html)
             text = re.sub(r'<li[^>]*>', '\n- ', text)  # Convert list items
-            text = re.sub(r'<[^>]+>', ' ', text)
+            text = re.sub(r'<[^<>]++>', ' ', text)
             text = re.sub(r'&amp;', '&', text)
             text = re.sub(r'&nbsp;', ' ', text)
             text = re.sub(r'[ \t]+', ' ', text)
@@ -332,51 +350,21 @@ class AnthropicExtractor(BaseJobExtractor[TitleFilters]):
             text = re.sub(r'\n\n- ', '\n- ', text)  # No blank lines between list items
             return text.strip()
 
-        def extract_section(pattern: str) -> str:
-            """Extract content between header matching pattern and next header.
+        def extract_section(header: str) -> str:
+            """Extract content between header and next header.
 
             Handles both h2 and h3 tags, with or without <strong> wrapper:
             - <h2>About the role</h2>
             - <h2 class="heading"><strong>About the role</strong></h2>
             - <h3><strong>About the Role</strong></h3>
 
-            Pattern matches the beginning of header text (allows extra text after).
+            Header matches the beginning of header text (allows extra text after).
+            Patterns are precompiled in _SECTION_RES, newer Greenhouse format first.
             """
-            # Try h2 with <strong> wrapper first (newer Greenhouse format)
-            match = re.search(
-                rf'<h2[^>]*>\s*<strong>{pattern}[^<]*</strong>\s*</h2>(.*?)(?=<h[23]|$)',
-                raw_content,
-                re.DOTALL | re.IGNORECASE
-            )
-            if match:
-                return strip_html(match.group(1))
-
-            # Try h3 with <strong> wrapper (some Anthropic pages use h3)
-            match = re.search(
-                rf'<h3[^>]*>\s*<strong>{pattern}[^<]*</strong>\s*</h3>(.*?)(?=<h[23]|$)',
-                raw_content,
-                re.DOTALL | re.IGNORECASE
-            )
-            if match:
-                return strip_html(match.group(1))
-
-            # Fallback: pattern directly in h2
-            match = re.search(
-                rf'<h2[^>]*>{pattern}[^<]*</h2>(.*?)(?=<h[23]|$)',
-                raw_content,
-                re.DOTALL | re.IGNORECASE
-            )
-            if match:
-                return strip_html(match.group(1))
-
-            # Fallback: pattern directly in h3
-            match = re.search(
-                rf'<h3[^>]*>{pattern}[^<]*</h3>(.*?)(?=<h[23]|$)',
-                raw_content,
-                re.DOTALL | re.IGNORECASE
-            )
-            if match:
-                return strip_html(match.group(1))
+            for pattern in _SECTION_RES[header]:
+                match = pattern.search(raw_content)
+                if match:
+                    return strip_html(match.group(1))
             return ''
 
         # Build description from role info and responsibilities
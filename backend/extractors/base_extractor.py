@@ -9,9 +9,20 @@ extractors must implement. The pipeline has three stages:
 3. Raw info extraction: Parse description/requirements (company-specific, abstract)
 """
 
+import asyncio
+import json
+import os
+import warnings
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, TypeVar, Generic, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import (
+    List, Dict, Any, Literal, Mapping, Optional, Tuple, TypeVar, Generic, AsyncIterator,
+    TYPE_CHECKING
+)
 import httpx
+import orjson
+
+from .config import filter_titles
 
 if TYPE_CHECKING:
     from .enums import Company
@@ -19,6 +30,68 @@ if TYPE_CHECKING:
 # Generic type for config
 ConfigType = TypeVar('ConfigType')
 
+# Max job pages fetched at once per extractor (crawl_raw_info / crawl_many)
+CRAWL_CONCURRENCY = int(os.environ.get("JH_CRAWL_CONCURRENCY", "10"))
+
+# Max make_request() calls in flight per host per extractor
+HOST_CONCURRENCY = int(os.environ.get("JH_HOST_CONCURRENCY", "10"))
+
+
+def find_json_ld(text: str, type_: str = 'JobPosting') -> Optional[Dict[str, Any]]:
+    """
+    Parse the first JSON-LD object of a schema.org type embedded in a page.
+
+    Locates each <script type="application/ld+json"> block with str.find and
+    decodes it with orjson, so string escapes (\\n, \\", \\uXXXX, surrogate
+    pairs) are handled by the JSON parser. Blocks with raw control characters
+    in strings (which orjson rejects) are retried with json.loads(strict=False).
+    Objects may be listed top-level or under "@graph", and @type may be a
+    string or a list. Blocks that fail to parse or hold no matching object
+    are skipped.
+
+    Args:
+        text: Page HTML
+        type_: Required @type value (e.g. 'JobPosting')
+
+    Returns:
+        Parsed object, or None if no matching block is found
+    """
+    pos = text.find('application/ld+json')
+    while pos != -1:
+        start = text.find('>', pos) + 1
+        end = text.find('</script>', start)
+        if start == 0 or end == -1:
+            return None
+        block = text[start:end]
+        try:
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
+            try:
+                data = json.loads(block, strict=False)
+            except ValueError:
+                data = None
+        item = _find_json_ld_type(data, type_)
+        if item is not None:
+            return item
+        pos = text.find('application/ld+json', end)
+    return None
+
+
+def _find_json_ld_type(data: Any, type_: str) -> Optional[Dict[str, Any]]:
+    """First object in a decoded JSON-LD block (list, @graph) whose @type is/includes type_"""
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_type = item.get('@type')
+        if item_type == type_ or (isinstance(item_type, list) and type_ in item_type):
+            return item
+        if '@graph' in item:
+            found = _find_json_ld_type(item['@graph'], type_)
+            if found is not None:
+                return found
+    return None
+
 
 class BaseJobExtractor(ABC, Generic[ConfigType]):
     """
@@ -36,12 +109,21 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
     4. _fetch_all_jobs(): Method to fetch and extract job objects
     5. extract_raw_info(): Method to parse description/requirements from raw content
 
+    Optionally, URL_BUILDER_KEY selects how job URLs are built (default 'id').
+
     Title filtering configuration is always passed externally via __init__(config=...)
 
     Pipeline stages:
     - Stage 1: extract_source_urls_metadata() → job list with URLs
     - Stage 2: crawl_raw_info(url) → raw HTML/JSON content (generic, in base class)
     - Stage 3: extract_raw_info(raw_content) → {description, requirements} (abstract)
+
+    HTTP connections:
+    Use the extractor as an async context manager so every request shares one
+    httpx.AsyncClient (connection pool + TLS sessions are reused):
+
+        async with get_extractor('google', config=filters) as extractor:
+            result = await extractor.extract_source_urls_metadata()
     """
 
     # Abstract class variables - must be defined by each concrete extractor
@@ -49,6 +131,43 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
     URL_PREFIX_JOB: str
     COMPANY_NAME: 'Company'  # Must be set to Company enum value in concrete classes
 
+    # Default HTTP headers, built once and sent by the shared client (see get_headers)
+    DEFAULT_HEADERS: Mapping[str, str] = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                     'AppleWebKit/537.36 (KHTML, like Gecko) '
+                     'Chrome/141.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'br, gzip',  # Brotli decoding via httpx[brotli]
+    }
+
+    # Adaptive backoff in make_request()/stream_request(): a throttled response
+    # (THROTTLE_STATUSES, or a 403 carrying Retry-After) doubles the host's delay
+    # (up to THROTTLE_MAX_DELAY seconds) and is retried up to THROTTLE_RETRIES
+    # times; each success halves the delay again. A bare 403 is a hard block and
+    # fails at once.
+    THROTTLE_STATUSES: frozenset = frozenset({429})
+    THROTTLE_RETRIES: int = 3
+    THROTTLE_BASE_DELAY: float = 0.5
+    THROTTLE_MAX_DELAY: float = 8.0
+
+    # Job field used to build URLs (see _build_url_from_job); override per extractor
+    URL_BUILDER_KEY: Literal['absolute_url', 'url', 'job_path', 'id'] = 'id'
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Verify that each subclass defines the required class variables.
+
+        Runs once per subclass at class definition, not on every instantiation.
+
+        Raises:
+            NotImplementedError: If API_URL, URL_PREFIX_JOB or COMPANY_NAME is missing
+        """
+        super().__init_subclass__(**kwargs)
+        for var in ('API_URL', 'URL_PREFIX_JOB', 'COMPANY_NAME'):
+            if not hasattr(cls, var):
+                raise NotImplementedError(f"{cls.__name__} must define {var} class variable")
+
     def __init__(self, config: ConfigType):
         """
         Initialize extractor with configuration
@@ -69,17 +188,45 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
             # No filtering
             extractor = GoogleExtractor(config=TitleFilters())
         """
-        # Verify that subclass defined required class variables
-        required_vars = ['API_URL', 'URL_PREFIX_JOB', 'COMPANY_NAME']
-        for var in required_vars:
-            if not hasattr(self.__class__, var):
-                raise NotImplementedError(
-                    f"{self.__class__.__name__} must define {var} class variable"
-                )
-
         # Always use provided config
         self.config = config
 
+        # Shared HTTP client, opened by __aenter__ and closed by __aexit__
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Bounds concurrent job-page fetches, however many callers gather at once
+        self._crawl_sem = asyncio.Semaphore(CRAWL_CONCURRENCY)
+
+        # Per-host request cap and current backoff delay (see _send_throttled)
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._host_delays: Dict[str, float] = {}
+
+    async def __aenter__(self) -> 'BaseJobExtractor[ConfigType]':
+        """Open the shared HTTP client used by make_request()"""
+        # HTTP/2 multiplexes concurrent page fetches over one TLS connection
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers=self.get_headers(),
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared HTTP client"""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client, if open
+
+        For callers that open the extractor with `await extractor.__aenter__()`
+        and shut it down explicitly; safe to call more than once.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     @abstractmethod
     async def _fetch_all_jobs(self) -> List[Dict[str, Any]]:
         """
@@ -154,36 +301,12 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
                 'excluded_jobs': []
             }
 
-        # Step 2: Apply title filtering and separate included/excluded
-        included_jobs = self._apply_title_filters(all_jobs)
-
-        # Find excluded jobs (those that didn't pass filter)
-        included_ids = {job.get('id') for job in included_jobs}
-        excluded_jobs = [job for job in all_jobs if job.get('id') not in included_ids]
-
-        # Step 3: Build metadata for included jobs
-        included_metadata = []
-        for job in included_jobs:
-            url = self._build_url_from_job(job)
-            if url:  # Only include if URL was successfully built
-                included_metadata.append({
-                    'id': str(job.get('id', '')),  # Convert to string
-                    'title': job.get('title', ''),
-                    'location': job.get('location', ''),
-                    'url': url
-                })
-
-        # Step 4: Build metadata for excluded jobs
-        excluded_metadata = []
-        for job in excluded_jobs:
-            url = self._build_url_from_job(job)
-            if url:  # Only include if URL can be built
-                excluded_metadata.append({
-                    'id': str(job.get('id', '')),  # Convert to string
-                    'title': job.get('title', ''),
-                    'location': job.get('location', ''),
-                    'url': url
-                })
+        # Step 2: Apply title filtering and separate included/excluded (one pass)
+        included_jobs, excluded_jobs = self._partition_by_title(all_jobs)
+
+        # Step 3: Build metadata for included and excluded jobs
+        included_metadata = self._jobs_to_metadata(included_jobs)
+        excluded_metadata = self._jobs_to_metadata(excluded_jobs)
 
         return {
             'total_count': total_count,
@@ -210,12 +333,32 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
         Raises:
             Exception: On HTTP errors or connection failures
         """
-        response = await self.make_request(
-            job_url,
-            timeout=15.0  # Longer timeout for full page
-        )
+        # Request stays inside the gate (at most CRAWL_CONCURRENCY in flight)
+        async with self._crawl_sem:
+            response = await self.make_request(
+                job_url,
+                timeout=15.0  # Longer timeout for full page
+            )
         return response.text
 
+    async def crawl_many(self, job_urls: List[str]) -> List[str]:
+        """
+        Fetch several job pages concurrently (Stage 2, batched).
+
+        Concurrency is bounded by the crawl semaphore in crawl_raw_info(),
+        set via the JH_CRAWL_CONCURRENCY env var (default 10).
+
+        Args:
+            job_urls: Full URLs to job posting pages
+
+        Returns:
+            Raw content strings, in input order
+
+        Raises:
+            Exception: On HTTP errors or connection failures (first failure propagates)
+        """
+        return await asyncio.gather(*(self.crawl_raw_info(url) for url in job_urls))
+
     @abstractmethod
     def extract_raw_info(self, raw_content: str) -> Dict[str, str]:
         """
@@ -240,6 +383,27 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
         """
         pass
 
+    async def extract_many(self, raw_contents: List[str]) -> List[Dict[str, str]]:
+        """
+        Run extract_raw_info() over several raw pages concurrently.
+
+        Parsing is CPU-bound regex/string work, so each page is offloaded to
+        the default thread pool via asyncio.to_thread. This lets parsing overlap
+        with in-flight HTTP fetches instead of blocking the event loop.
+
+        Args:
+            raw_contents: Raw HTML/JSON strings from crawl_raw_info()
+
+        Returns:
+            List of {'description', 'requirements'} dicts, in input order
+
+        Raises:
+            ValueError: If any page cannot be parsed (first failure propagates)
+        """
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.extract_raw_info, content) for content in raw_contents)
+        )
+
     def _apply_title_filters(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Apply title filtering to job objects
@@ -250,112 +414,93 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
         Returns:
             Filtered list of job objects
         """
-        if not jobs:
-            return []
+        matcher = self.config.matcher
+        return [job for job in jobs if matcher(job.get('title', ''))]
 
-        # Extract titles
-        titles = [job.get('title', '') for job in jobs]
-
-        # Use base class filter_by_title method
-        matches = self.filter_by_title(
-            titles,
-            include_terms=self.config.include,
-            exclude_terms=self.config.exclude
-        )
-
-        # Return only matching jobs
-        return [job for job, match in zip(jobs, matches) if match]
-
-    def _build_url_from_job(self, job: Dict[str, Any]) -> str:
+    def _partition_by_title(
+        self,
+        jobs: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Build URL from a single job object
+        Split job objects into (included, excluded) by title filters
 
         Args:
-            job: Job object with 'id' and 'response_data'
+            jobs: List of job objects with 'title' field
 
         Returns:
-            Job URL string, or empty string if URL cannot be built
+            Tuple of (jobs that passed the filter, jobs that were filtered out)
         """
-        job_id = job.get('id')
-        response_data = job.get('response_data', {})
+        # Compiled matcher is memoized per filter configuration
+        matches = self.config.matcher
 
-        # Case 1: Pre-built full URL in response_data
-        if isinstance(response_data, dict):
-            # Check for absolute_url (Anthropic/Greenhouse)
-            if 'absolute_url' in response_data:
-                return response_data['absolute_url']
-            # Check for url field
-            elif 'url' in response_data:
-                return response_data['url']
-            # Check for job_path (Amazon)
-            elif 'job_path' in response_data:
-                return f"{self.URL_PREFIX_JOB}{response_data['job_path']}"
+        included, excluded = [], []
+        for job in jobs:
+            (included if matches(job.get('title', '')) else excluded).append(job)
+        return included, excluded
 
-        # Case 2: Construct URL from prefix + id
-        if job_id:
-            return f"{self.URL_PREFIX_JOB}/{job_id}"
+    def _jobs_to_metadata(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Build {id, title, location, url} metadata for job objects
 
-        return ''
+        Jobs whose URL cannot be built are skipped.
 
-    def _build_urls_from_jobs(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        Args:
+            jobs: List of job objects
+
+        Returns:
+            List of metadata dicts
         """
-        Build URLs from job objects
+        build_url = self._build_url_from_job
+        return [
+            {
+                'id': str(job.get('id', '')),  # Convert to string
+                'title': job.get('title', ''),
+                'location': job.get('location', ''),
+                'url': url
+            }
+            for job in jobs
+            for url in (build_url(job),)
+            if url  # Only include if URL was successfully built
+        ]
 
-        Handles multiple cases:
-        1. If response_data contains 'absolute_url', use that (e.g., Anthropic)
-        2. If response_data contains 'url', use that
-        3. If response_data contains 'job_path', use URL_PREFIX_JOB + job_path (e.g., Amazon)
-        4. Otherwise, construct URL from URL_PREFIX_JOB + id
+    def _build_url_from_job(self, job: Dict[str, Any]) -> str:
+        """
+        Build URL from a single job object
+
+        Dispatches on URL_BUILDER_KEY, the one field this extractor populates:
+        - 'absolute_url' / 'url': pre-built full URL in response_data
+        - 'job_path': URL_PREFIX_JOB + response_data['job_path'] (e.g., Amazon)
+        - 'id': URL_PREFIX_JOB + '/' + job id
 
         Args:
-            jobs: List of job objects
+            job: Job object with 'id' and 'response_data'
 
         Returns:
-            List of job URLs
+            Job URL string, or empty string if URL cannot be built
         """
-        urls = []
+        key = self.URL_BUILDER_KEY
 
-        for job in jobs:
+        if key == 'id':
             job_id = job.get('id')
-            response_data = job.get('response_data', {})
-
-            # Case 1: Pre-built full URL in response_data
-            if isinstance(response_data, dict):
-                # Check for absolute_url (Anthropic/Greenhouse)
-                if 'absolute_url' in response_data:
-                    urls.append(response_data['absolute_url'])
-                    continue
-                # Check for url field
-                elif 'url' in response_data:
-                    urls.append(response_data['url'])
-                    continue
-                # Check for job_path (Amazon)
-                elif 'job_path' in response_data:
-                    urls.append(f"{self.URL_PREFIX_JOB}{response_data['job_path']}")
-                    continue
-
-            # Case 2: Construct URL from prefix + id
-            if job_id:
-                urls.append(f"{self.URL_PREFIX_JOB}/{job_id}")
-
-        return urls
-
-    def get_headers(self) -> Dict[str, str]:
+            return f"{self.URL_PREFIX_JOB}/{job_id}" if job_id else ''
+
+        response_data = job.get('response_data') or {}
+        if key == 'job_path':
+            job_path = response_data.get('job_path')
+            return f"{self.URL_PREFIX_JOB}{job_path}" if job_path else ''
+
+        return response_data.get(key) or ''
+
+    def get_headers(self) -> Mapping[str, str]:
         """
         Get default HTTP headers for requests
 
-        Override this method if company needs specific headers.
+        Override DEFAULT_HEADERS (or this method) if company needs specific headers.
 
         Returns:
-            Dict of HTTP headers
+            Shared, read-only mapping of HTTP headers (do not mutate)
         """
-        return {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                         'AppleWebKit/537.36 (KHTML, like Gecko) '
-                         'Chrome/141.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
+        return self.DEFAULT_HEADERS
 
     async def make_request(
         self,
@@ -369,6 +514,11 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
         """
         Helper method to make HTTP requests with consistent error handling
 
+        Uses the shared client when inside `async with extractor:`; otherwise
+        falls back to a one-shot client (deprecated - pays a fresh connection
+        and TLS handshake per call). Requests are capped per host and retried
+        with adaptive backoff when throttled (see _send_throttled).
+
         Args:
             url: URL to request
             method: HTTP method (GET, POST, etc.)
@@ -385,21 +535,142 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
             httpx.TimeoutException: On request timeout
             httpx.ConnectError: On connection failure
         """
-        request_headers = self.get_headers()
-        if headers:
-            request_headers.update(headers)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers=request_headers,
-                timeout=timeout
+        # Default headers live on the client; only per-call overrides are sent
+        request_kwargs = dict(
+            method=method,
+            url=url,
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=timeout
+        )
+
+        if self._client is not None:
+            async with self._send_throttled(self._client, request_kwargs) as response:
+                pass
+        else:
+            warnings.warn(
+                f"{self.__class__.__name__}.make_request() called outside 'async with'; "
+                "using a one-shot HTTP client",
+                DeprecationWarning,
+                stacklevel=2
             )
-            response.raise_for_status()
-            return response
+            async with httpx.AsyncClient(headers=self.get_headers()) as client:
+                async with self._send_throttled(client, request_kwargs) as response:
+                    pass
+
+        response.raise_for_status()
+        return response
+
+    def _is_throttled(self, response: httpx.Response) -> bool:
+        """Whether a response asks us to slow down (and is worth retrying)"""
+        return (response.status_code in self.THROTTLE_STATUSES
+                or (response.status_code == 403 and 'Retry-After' in response.headers))
+
+    @asynccontextmanager
+    async def _send_throttled(
+        self,
+        client: httpx.AsyncClient,
+        request_kwargs: Dict[str, Any],
+        stream: bool = False
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Send a request under the host's concurrency cap, backing off when throttled
+
+        At most HOST_CONCURRENCY requests per host are in flight (a streamed
+        response keeps its slot until the caller's block exits). While a host
+        has a backoff delay, each request to it first sleeps that long before
+        taking a slot, so waiting retries don't starve other requests. A
+        throttled response (see _is_throttled) doubles the delay, honoring a
+        numeric Retry-After if larger, and is retried up to THROTTLE_RETRIES
+        times; a success halves it.
+
+        Yields:
+            The final response (may still be throttled after retries)
+        """
+        host = httpx.URL(request_kwargs['url']).host
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = self._host_sems[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+
+        for attempt in range(self.THROTTLE_RETRIES + 1):
+            delay = self._host_delays.get(host, 0.0)
+            if delay:
+                await asyncio.sleep(delay)
+
+            async with sem:
+                response = await client.send(client.build_request(**request_kwargs), stream=stream)
+                try:
+                    throttled = self._is_throttled(response)
+                    if throttled:
+                        retry_after = response.headers.get('Retry-After', '')
+                        delay = max(delay * 2, self.THROTTLE_BASE_DELAY,
+                                    float(retry_after) if retry_after.isdigit() else 0.0)
+                        self._host_delays[host] = min(delay, self.THROTTLE_MAX_DELAY)
+                    else:
+                        # Recover gradually; drop the delay once below the base step
+                        delay /= 2
+                        self._host_delays[host] = delay if delay >= self.THROTTLE_BASE_DELAY else 0.0
+
+                    if not throttled or attempt == self.THROTTLE_RETRIES:
+                        yield response
+                        return
+                finally:
+                    await response.aclose()
+
+    @asynccontextmanager
+    async def stream_request(
+        self,
+        url: str,
+        method: str = 'GET',
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: float = 10.0
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Like make_request(), but yields a streaming response whose body has
+        not been read yet (consume it with response.aiter_bytes()). Shares
+        make_request()'s per-host cap and throttle backoff.
+
+        Usage:
+            async with self.stream_request(url, params=params) as response:
+                async for chunk in response.aiter_bytes():
+                    ...
+
+        Raises:
+            httpx.HTTPStatusError: On HTTP error responses
+            httpx.TimeoutException: On request timeout
+            httpx.ConnectError: On connection failure
+        """
+        request_kwargs = dict(
+            method=method,
+            url=url,
+            params=params,
+            headers=headers,
+            timeout=timeout
+        )
+
+        if self._client is not None:
+            async with self._send_throttled(self._client, request_kwargs, stream=True) as response:
+                response.raise_for_status()
+                yield response
+        else:
+            async with httpx.AsyncClient(headers=self.get_headers()) as client:
+                async with self._send_throttled(client, request_kwargs, stream=True) as response:
+                    response.raise_for_status()
+                    yield response
+
+    def _parse_json(self, response: httpx.Response) -> Any:
+        """
+        Decode a JSON response body with orjson
+
+        Parses the raw UTF-8 bytes directly (no text decode step); several
+        times faster than response.json() on large API payloads.
+
+        Raises:
+            orjson.JSONDecodeError: If the body is not valid JSON (a ValueError)
+        """
+        return orjson.loads(response.content)
 
     def filter_by_title(
         self,
@@ -426,41 +697,12 @@ class BaseJobExtractor(ABC, Generic[ConfigType]):
 
             Returns: [True, False, False]
         """
-        exclude_terms = exclude_terms or []
-
-        results = []
-        for title in titles:
-            if not title:
-                results.append(False)
-                continue
-
-            title_lower = title.lower()
-
-            # Check exclude list first (if excluded, reject immediately)
-            excluded = False
-            for term in exclude_terms:
-                if term.lower() in title_lower:
-                    excluded = True
-                    break
-
-            if excluded:
-                results.append(False)
-                continue
-
-            # Check include list (OR logic - must match at least one)
-            if include_terms is not None:
-                # Explicit include filter (not None)
-                included = False
-                for term in include_terms:
-                    if term.lower() in title_lower:
-                        included = True
-                        break
-                results.append(included)
-            else:
-                # None means include all (that weren't excluded)
-                results.append(True)
-
-        return results
+        # Compiled patterns are memoized per (include, exclude) combination
+        return filter_titles(
+            titles,
+            tuple(include_terms) if include_terms is not None else None,
+            tuple(exclude_terms or ())
+        )
 
     def __repr__(self) -> str:
         """String representation of extractor"""
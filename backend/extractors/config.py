@@ -11,11 +11,148 @@ This provides:
 - Type checking
 """
 
-from typing import Dict, List, Optional
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 
-@dataclass
+def compile_terms(terms: Optional[Iterable[str]]) -> Optional[re.Pattern]:
+    """
+    Compile filter terms into one case-insensitive alternation regex.
+
+    A single pattern.search(title) replaces a Python loop of
+    `term.lower() in title.lower()` checks.
+
+    Args:
+        terms: Substrings to match, or None
+
+    Returns:
+        Compiled pattern, or None if terms is None. An empty list compiles to
+        a pattern that never matches.
+    """
+    if terms is None:
+        return None
+    terms = list(terms)
+    if not terms:
+        return re.compile('(?!)')
+    return re.compile('|'.join(map(re.escape, terms)), re.IGNORECASE)
+
+
+def title_matches(
+    title: str,
+    include_re: Optional[re.Pattern],
+    exclude_re: Optional[re.Pattern]
+) -> bool:
+    """
+    Check one title against compiled include/exclude patterns.
+
+    Exclude wins over include; include_re=None means include all.
+    """
+    if not title:
+        return False
+    if exclude_re is not None and exclude_re.search(title):
+        return False
+    return include_re is None or include_re.search(title) is not None
+
+
+@lru_cache(maxsize=128)
+def compile_matcher(
+    include: Optional[Tuple[str, ...]],
+    exclude: Tuple[str, ...]
+) -> Callable[[str], bool]:
+    """
+    Build (and memoize) a title -> bool matcher for a filter configuration.
+
+    Keyed by the term tuples, so extractors sharing identical filters (e.g. one
+    DB settings row used across companies) reuse the same compiled patterns.
+
+    Args:
+        include: Include terms (None = include all)
+        exclude: Exclude terms
+
+    Returns:
+        Function returning True if a title passes the filters
+    """
+    include_re = compile_terms(include)
+    exclude_re = compile_terms(exclude or None)
+
+    def matcher(title: str) -> bool:
+        return title_matches(title, include_re, exclude_re)
+
+    return matcher
+
+
+# Above titles x exclude terms, filter_titles() scans all titles in one buffer
+BATCH_SCAN_THRESHOLD = 10_000
+
+
+def _scan_hits(terms: Iterable[str], text: str, offsets: List[int]) -> List[bool]:
+    """
+    Mark which titles in a joined buffer contain any of the terms.
+
+    Each term is located with str.find over the whole buffer; after a hit the
+    search resumes at the next title, so a title is found at most once per term.
+
+    Args:
+        terms: Lowercased substrings (none may contain a newline)
+        text: Lowercased titles joined by newlines
+        offsets: Start offset of each title in text, plus len(text) + 1
+    """
+    hits = [False] * (len(offsets) - 1)
+    find = text.find
+    for term in terms:
+        pos = find(term)
+        while pos != -1:
+            i = bisect_right(offsets, pos) - 1
+            hits[i] = True
+            pos = find(term, offsets[i + 1])
+    return hits
+
+
+def filter_titles(
+    titles: List[str],
+    include: Optional[Tuple[str, ...]],
+    exclude: Tuple[str, ...]
+) -> List[bool]:
+    """
+    Apply include/exclude terms to many titles at once.
+
+    Small batches call the memoized matcher per title. Large ASCII batches
+    (len(titles) * len(exclude) > BATCH_SCAN_THRESHOLD) lowercase all titles
+    into one buffer and search it once per term, so the inner loop runs in C.
+
+    Returns:
+        List of booleans, same semantics as compile_matcher()
+    """
+    terms = (include or ()) + exclude
+    batch = len(titles) * len(exclude) > BATCH_SCAN_THRESHOLD
+    text = '\n'.join(titles) if batch else ''
+    # ASCII-only keeps str.lower() equivalent to the matcher's re.IGNORECASE
+    if (
+        not batch
+        or not text.isascii()
+        or not all(term.isascii() and '\n' not in term for term in terms)
+    ):
+        matcher = compile_matcher(include, exclude)
+        return [matcher(title) for title in titles]
+
+    text = text.lower()
+    offsets = [0, *accumulate(len(title) + 1 for title in titles)]
+    excluded = _scan_hits((term.lower() for term in exclude), text, offsets)
+    included = None
+    if include is not None:
+        included = _scan_hits((term.lower() for term in include), text, offsets)
+
+    return [
+        bool(title) and not excluded[i] and (included is None or included[i])
+        for i, title in enumerate(titles)
+    ]
+
+
+@dataclass(slots=True)
 class TitleFilters:
     """
     Title filtering configuration.
@@ -43,6 +180,16 @@ class TitleFilters:
     include: Optional[List[str]] = None  # None = include all, List = OR logic (match any)
     exclude: List[str] = field(default_factory=list)  # AND logic: reject all
 
+    @property
+    def matcher(self) -> Callable[[str], bool]:
+        """Memoized title -> bool matcher for the current include/exclude terms."""
+        include = tuple(self.include) if self.include is not None else None
+        return compile_matcher(include, tuple(self.exclude))
+
+    def matches(self, title: str) -> bool:
+        """True if title passes the filters (not excluded, and included if include is set)."""
+        return self.matcher(title)
+
     def to_dict(self) -> Dict[str, List[str]]:
         """Convert to dict for API response. Always returns [] instead of None."""
         return {"include": self.include or [], "exclude": self.exclude}
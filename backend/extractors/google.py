@@ -19,12 +19,82 @@ AF_initDataCallback({
 </script>
 """
 
-from typing import List, Dict, Any
+from contextlib import aclosing
+from typing import List, Dict, Any, AsyncIterator, Iterable, Tuple
+import asyncio
 import re
+import logging
 from .base_extractor import BaseJobExtractor
 from .config import TitleFilters
 from .enums import Company
 
+logger = logging.getLogger(__name__)
+
+# Pattern: ["job_id","title","url", ...] - job IDs are 15-20 digits
+# Note: We use a simpler pattern to avoid escape issues
+# Bytes pattern (pure ASCII): matched on the raw body, so only the matched
+# id/title slices are ever decoded - never the whole page
+_JOB_RE = re.compile(rb'\["(\d{15,20})","([^"]*?)","https://www\.google\.com/about/careers')
+
+# Bytes kept between streamed chunks so a job entry split across a chunk
+# boundary is still matched (entries are well under this size)
+_STREAM_OVERLAP = 4096
+
+# strip_html pass 1: tags in one scan. Groups 1-4 are <br>, <li>, </li>,
+# any other tag. Possessive and stopping at '<', so a stray '<' is kept as
+# text instead of rescanning to the end.
+_HTML_TAG_RE = re.compile(r'(<br\s*/?>)|(<li[^>]*>)|(</li>)|(<[^<>]++>)')
+_TAG_REPLACEMENTS = (None, '\n', '\n- ', '', ' ')
+
+# strip_html pass 2: entities, only after every tag is gone (a tag inside
+# an entity, '&</li>amp;', must still decode). '&amp;nbsp;' etc. decode
+# twice, matching the old one-regex-per-entity chain.
+_ENTITY_RE = re.compile(r'&amp;(?:nbsp;|#39;|quot;)|&amp;|&nbsp;|&#39;|&quot;')
+_ENTITIES = {'&amp;': '&', '&nbsp;': ' ', '&#39;': "'", '&quot;': '"'}
+
+# strip_html pass 3: escaped newlines, indentation after newlines, space runs
+_WS_RE = re.compile(r'(\\n)|(\n[ \t]+)|[ \t]+')
+
+# strip_html pass 4: at most one blank line, none between list items
+_BLANK_LINES_RE = re.compile(r'\n\n+(- )?')
+
+# Job page sections: <h3>Header</h3> followed by content until next <h3> or </div>.
+# One scan finds section headers (group 1) and section ends alike; each section
+# is sliced from its header to the next token (or end of document).
+_SECTION_HEADERS = (
+    'About the job',
+    'Responsibilities',
+    'Minimum qualifications',
+    'Preferred qualifications',
+)
+_SECTION_TOKEN_RE = re.compile(
+    r'<h3[^>]*>(' + '|'.join(_SECTION_HEADERS) + r')[^<]*</h3>|<h3|</div><div class="',
+    re.IGNORECASE
+)
+
+
+def _replace_html_tag(match: re.Match) -> str:
+    """Replacement for _HTML_TAG_RE matches"""
+    return _TAG_REPLACEMENTS[match.lastindex]
+
+
+def _replace_entity(match: re.Match) -> str:
+    """Replacement for _ENTITY_RE matches"""
+    entity = match.group(0)
+    if len(entity) > 5 and entity.startswith('&amp;'):
+        entity = '&' + entity[5:]
+    return _ENTITIES[entity]
+
+
+def _replace_whitespace(match: re.Match) -> str:
+    """Replacement for _WS_RE matches"""
+    return '\n' if match.lastindex else ' '
+
+
+def _replace_blank_lines(match: re.Match) -> str:
+    """Replacement for _BLANK_LINES_RE matches"""
+    return '\n- ' if match.group(1) else '\n\n'
+
 
 class GoogleExtractor(BaseJobExtractor[TitleFilters]):
     """
@@ -42,9 +112,13 @@ class GoogleExtractor(BaseJobExtractor[TitleFilters]):
     API_URL = "https://www.google.com/about/careers/applications/jobs/results"
     URL_PREFIX_JOB = "https://www.google.com/about/careers/applications/jobs/results"
 
+    # Max pagination requests in flight at once (also the batch size)
+    PAGE_CONCURRENCY = 5
+
     def __init__(self, config):
         """Initialize Google extractor"""
         super().__init__(config)
+        self._page_sem = asyncio.Semaphore(self.PAGE_CONCURRENCY)
 
     def _build_params(self, page: int = None) -> Dict[str, Any]:
         """
@@ -70,14 +144,14 @@ class GoogleExtractor(BaseJobExtractor[TitleFilters]):
 
         return params
 
-    def _extract_jobs_from_html(self, html: str) -> List[Dict[str, str]]:
+    def _jobs_from_matches(self, matches: Iterable[Tuple[bytes, bytes]]) -> List[Dict[str, str]]:
         """
-        Extract job data (ID, title, location) from HTML
+        Build job objects from (job_id, title) matches, keeping first occurrence
 
-        Uses pattern: ["<job_id>","<title>","<url>", ...]
+        Only first occurrences are decoded (IDs are ASCII digits, titles UTF-8).
 
         Args:
-            html: HTML response
+            matches: Raw (job_id, title) byte pairs in page order
 
         Returns:
             List of job objects with 'id', 'title', and 'location' fields
@@ -85,21 +159,44 @@ class GoogleExtractor(BaseJobExtractor[TitleFilters]):
         jobs = []
         seen_ids = set()
 
-        # Pattern: ["job_id","title","url", ...]
-        # Job IDs are 15-20 digits
-        # Note: We use a simpler pattern to avoid escape issues
-        pattern = r'\["(\d{15,20})","([^"]*?)","https://www\.google\.com/about/careers'
-        matches = re.findall(pattern, html)
-
         for job_id, title in matches:
             if job_id not in seen_ids:
                 # Use hardcoded location from filters (California, USA)
                 location = "California, USA"  # Matches the filter
-                jobs.append({'id': job_id, 'title': title, 'location': location})
+                jobs.append({
+                    'id': job_id.decode('ascii'),
+                    'title': title.decode('utf-8', errors='replace'),
+                    'location': location
+                })
                 seen_ids.add(job_id)
 
         return jobs
 
+    async def _stream_job_matches(self, params: Dict[str, Any]) -> AsyncIterator[Tuple[bytes, bytes]]:
+        """
+        Stream a results page and yield (job_id, title) as they are found
+
+        The raw body is scanned chunk by chunk without decoding, so the full
+        page is never held in memory. Only an unmatched tail of at most
+        _STREAM_OVERLAP bytes is carried between chunks.
+
+        Args:
+            params: Query parameters for the results page
+
+        Yields:
+            Raw (job_id, title) byte tuples in page order (may contain duplicates)
+        """
+        buffer = bytearray()
+
+        async with self.stream_request(self.API_URL, params=params, timeout=10.0) as response:
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
+                consumed = 0
+                for match in _JOB_RE.finditer(buffer):
+                    yield match.group(1), match.group(2)
+                    consumed = match.end()
+                del buffer[:max(consumed, len(buffer) - _STREAM_OVERLAP)]
+
     async def _fetch_jobs_page(self, page: int = 1) -> List[Dict[str, str]]:
         """
         Fetch one page of jobs
@@ -113,26 +210,27 @@ class GoogleExtractor(BaseJobExtractor[TitleFilters]):
         params = self._build_params(page)
 
         try:
-            response = await self.make_request(
-                self.API_URL,
-                params=params,
-                timeout=10.0
-            )
+            async with self._page_sem:
+                async with aclosing(self._stream_job_matches(params)) as stream:
+                    matches = [match async for match in stream]
 
-            jobs = self._extract_jobs_from_html(response.text)
-            return jobs
+            return self._jobs_from_matches(matches)
 
-        except Exception as e:
-            print(f"Error fetching Google jobs page {page}: {e}")
+        except Exception:
+            logger.exception("Error fetching Google jobs page %s", page)
             return []
 
     async def _fetch_all_jobs(self) -> List[Dict[str, Any]]:
         """
         Fetch all jobs using pagination
 
+        Pages are requested in batches of PAGE_CONCURRENCY so a crawl costs
+        ~1 round-trip per batch instead of per page.
+
         Stops automatically when:
         - No jobs are returned
         - No new jobs are found (all duplicates)
+        - A page is shorter than the page before it (last page)
 
         Returns:
             List of job objects with standardized structure:
@@ -142,41 +240,58 @@ class GoogleExtractor(BaseJobExtractor[TitleFilters]):
                 'response_data': dict  # Contains original data from HTML
             }
         """
-        all_jobs = []
-        seen_ids = set()
+        # Job ID -> standardized job; dict keeps insertion (page) order and
+        # doubles as the dedup set
+        all_jobs_by_id: Dict[str, Dict[str, Any]] = {}
+        last_page_size = None
         page = 1
 
         while True:
-            jobs = await self._fetch_jobs_page(page)
-
-            if not jobs:
-                # No jobs found, stop
-                break
-
-            # Add only new jobs (deduplicate by ID)
-            new_jobs = []
-            for job in jobs:
-                job_id = job.get('id')
-                if job_id and job_id not in seen_ids:
-                    # Convert to standardized format
-                    standardized_job = {
-                        'id': job_id,
-                        'title': job.get('title', ''),
-                        'location': job.get('location', 'California, USA'),
-                        'response_data': job  # Preserve original data
-                    }
-                    new_jobs.append(standardized_job)
-                    seen_ids.add(job_id)
-
-            all_jobs.extend(new_jobs)
-
-            # Stop if no new jobs (reached end of pagination)
-            if len(new_jobs) == 0:
+            # Fetch the next batch of pages concurrently (bounded by _page_sem)
+            pages = range(page, page + self.PAGE_CONCURRENCY)
+            tasks = [asyncio.create_task(self._fetch_jobs_page(p)) for p in pages]
+
+            # Consume pages in order, stopping where sequential paging would
+            reached_end = False
+            try:
+                for task in tasks:
+                    jobs = await task
+                    if not jobs:
+                        # No jobs found, stop
+                        reached_end = True
+                        break
+
+                    # Add only new jobs (deduplicate by ID)
+                    prev_count = len(all_jobs_by_id)
+                    for job in jobs:
+                        job_id = job.get('id')
+                        if job_id and job_id not in all_jobs_by_id:
+                            # Convert to standardized format
+                            all_jobs_by_id[job_id] = {
+                                'id': job_id,
+                                'title': job.get('title', ''),
+                                'location': job.get('location', 'California, USA'),
+                                'response_data': job  # Preserve original data
+                            }
+
+                    # Stop if no new jobs, or a short page (reached end of pagination)
+                    if (len(all_jobs_by_id) == prev_count
+                            or (last_page_size is not None and len(jobs) < last_page_size)):
+                        reached_end = True
+                        break
+                    last_page_size = len(jobs)
+            finally:
+                # Drop requests for pages past the end (no-op for finished tasks)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            if reached_end:
                 break
 
-            page += 1
+            page += self.PAGE_CONCURRENCY
 
-        return all_jobs
+        return list(all_jobs_by_id.values())
 
     def extract_raw_info(self, raw_content: str) -> dict:
         """
@@ -202,28 +317,30 @@ class GoogleExtractor(BaseJobExtractor[TitleFilters]):
 
         def strip_html(html: str) -> str:
             """Strip HTML tags and normalize whitespace"""
-            text = re.sub(r'<br\s*/?>', '\n', html)
-            text = re.sub(r'<li[^>]*>', '\n- ', text)  # Convert list items
-            text = re.sub(r'</li>', '', text)
-            text = re.sub(r'<[^>]+>', ' ', text)
-            text = re.sub(r'&amp;', '&', text)
-            text = re.sub(r'&nbsp;', ' ', text)
-            text = re.sub(r'&#39;', "'", text)
-            text = re.sub(r'&quot;', '"', text)
-            text = re.sub(r'[ \t]+', ' ', text)
-            text = re.sub(r'\n +', '\n', text)
-            text = re.sub(r'\\n', '\n', text)  # Escaped newlines
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            text = re.sub(r'\n\n- ', '\n- ', text)  # No blank lines between list items
+            text = _HTML_TAG_RE.sub(_replace_html_tag, html)
+            text = _ENTITY_RE.sub(_replace_entity, text)
+            text = _WS_RE.sub(_replace_whitespace, text)
+            text = _BLANK_LINES_RE.sub(_replace_blank_lines, text)
             return text.strip()
 
-        def extract_section(header_pattern: str) -> str:
-            """Extract content after h3 header until next h3 or section end"""
-            # Pattern: <h3>Header</h3> followed by content until next <h3> or </div>
-            pattern = rf'<h3[^>]*>{header_pattern}[^<]*</h3>(.*?)(?=<h3|</div><div class="|$)'
-            match = re.search(pattern, raw_content, re.DOTALL | re.IGNORECASE)
-            if match:
-                return strip_html(match.group(1))
+        # Slice every known section in a single pass (first occurrence wins)
+        sections: Dict[str, str] = {}
+        open_header, start = None, 0
+        for match in _SECTION_TOKEN_RE.finditer(raw_content):
+            if open_header is not None:
+                sections[open_header] = raw_content[start:match.start()]
+                open_header = None
+            header = match.group(1)
+            if header and header.lower() not in sections:
+                open_header, start = header.lower(), match.end()
+        if open_header is not None:
+            sections[open_header] = raw_content[start:]
+
+        def extract_section(header: str) -> str:
+            """Content after h3 header until next h3 or section end"""
+            section_html = sections.get(header.lower())
+            if section_html is not None:
+                return strip_html(section_html)
             return ''
 
         # Build description from About the job and Responsibilities
@@ -19,9 +19,90 @@ Sample API Response:
 """
 
 from typing import List, Dict, Any
-from .base_extractor import BaseJobExtractor
+import asyncio
+import html
+import logging
+from .base_extractor import BaseJobExtractor, find_json_ld
 from .config import TitleFilters
 from .enums import Company
+from .section_splitter import SectionSplitter
+
+logger = logging.getLogger(__name__)
+
+
+# Qualifications section markers, in priority order (first pattern found wins).
+# Netflix uses various patterns:
+# - <b><span>Qualifications:</span></b>
+# - <b><span>Basic Qualifications:</span></b>
+# - <strong>Qualifications:</strong>
+# - <h2>Who you are</h2>
+# - "We're Eager to Talk to You If:" (plain text in <p>)
+_QUAL_PATTERNS = (
+    r'<(?:strong|b)[^>]*>\s*<span>\s*(?:Basic )?Qualifications?:?\s*</span>\s*</(?:strong|b)>',  # Netflix: <b><span>Qualifications:</span></b>
+    r'<(?:strong|b)[^>]*>\s*(?:We are looking for individuals with the following )?(?:Basic )?qualifications?:?\s*</(?:strong|b)>',
+    r'<h2[^>]*>\s*(?:Required |Basic )?Qualifications?:?\s*</h2>',
+    r'<(?:strong|b)[^>]*>\s*Requirements?:?\s*</(?:strong|b)>',
+    r'<h2[^>]*>\s*<span>\s*Who you are\s*</span>\s*</h2>',  # Netflix variant
+    r'<h2[^>]*>\s*Who you are\s*</h2>',  # Netflix variant without span
+    r"<p>We&#39;re Eager to Talk to You If:?</p>",  # Netflix variant: plain text requirement header
+    r"<p>We're Eager to Talk to You If:?</p>",  # Netflix variant: decoded
+    r'<(?:strong|b)[^>]*>Must-Have Skills\s*<span>:?</span>\s*</(?:strong|b)>',  # Netflix: <b>Must-Have Skills<span>:</span></b>
+    r'<(?:strong|b)[^>]*>Must-Have Skills:?\s*</(?:strong|b)>',  # Netflix: <b>Must-Have Skills:</b>
+    r'<h2[^>]*>\s*What we are looking for\s*</h2>',  # Netflix variant
+    r'<(?:strong|b)[^>]*>\s*What we are looking for:?\s*</(?:strong|b)>',  # Netflix: <b>What we are looking for:</b>
+    r'<(?:strong|b)[^>]*>\s*You will enjoy working with us if you:?\s*</(?:strong|b)>',  # Netflix variant
+    r"<(?:strong|b)[^>]*>\s*Skills\s*&amp;\s*experience\s+we['\u2019]re\s+seeking:?\s*</(?:strong|b)>",  # Netflix: <b>Skills & experience we're seeking:</b>
+    r'<p>(?:<br\s*/?>)?What we are looking for in you:?</p>',  # Netflix: <p>What we are looking for in you:</p>
+    r"<h[23]>\s*Skills\s*&amp;\s*experience\s+we['\u2019]re\s+seeking:?\s*</h[23]>",  # Netflix: <h2/h3>Skills & experience we're seeking:</h2/h3>
+    r'<p>What you need to have</p>',  # Netflix: <p>What you need to have</p>
+    r'<p>(?:<br\s*/?>)?Who you are:?</p>',  # Netflix: <p>Who you are:</p> or <p><br />Who you are:</p>
+    r'<p><b>(?:<span>)?What sets you apart(?:</span>)?</b></p>',  # Netflix: <p><b><span>What sets you apart</span></b></p>
+    r'<h2>(?:<span>)?About You(?:</span>)?</h2>',  # Netflix: <h2><span>About You</span></h2>
+    r'<h2>(?:<span>)?Must Have(?:</span>)?</h2>',  # Netflix: <h2><span>Must Have</span></h2>
+    r'<p>(?:<br\s*/?>)?What you need to be successful:?</p>',  # Netflix: <p>What you need to be successful:</p>
+    r'<span>We are confident you can do this job if you\.{3}</span>',  # Netflix: We are confident you can do this job if you...
+    r'<p><b>(?:<span>)?You will thrive in the role if:?(?:</span>)?</b></p>',  # Netflix: <p><b><span>You will thrive in the role if:</span></b></p>
+    r'<p><b>(?:<span>)?Desired Background:?(?:</span>)?</b></p>',  # Netflix: <p><b><span>Desired Background:</span></b></p>
+    r'<h2><b>(?:<span>)?Requirements:?(?:</span>)?</b></h2>',  # Netflix: <h2><b><span>Requirements:</span></b></h2>
+)
+
+# "Nice to have" markers within requirements, in priority order
+_NICE_TO_HAVE_PATTERNS = (
+    r'<(?:strong|b)[^>]*>\s*<span>\s*Nice To Have:?\s*</span>\s*</(?:strong|b)>',  # Netflix: <b><span>Nice To Have:</span></b>
+    r'<(?:strong|b)[^>]*>\s*Nice to have:?\s*</(?:strong|b)>',
+    r'<(?:strong|b)[^>]*>\s*Preferred:?\s*</(?:strong|b)>',
+    r'<h2[^>]*>\s*Nice to have:?\s*</h2>',
+    r'<h2[^>]*>\s*<span>\s*What sets you apart\s*</span>\s*</h2>',  # Netflix variant
+    r'<h2[^>]*>\s*What sets you apart\s*</h2>',  # Netflix variant without span
+    r'<li>Some nice to haves:',  # Netflix variant: inline in list item
+    r'<(?:strong|b)[^>]*>Nice-to-Have Skills\s*<span>:?</span>\s*</(?:strong|b)>',  # Netflix: <b>Nice-to-Have Skills<span>:</span></b>
+    r'<(?:strong|b)[^>]*>Nice-to-Have Skills:?\s*</(?:strong|b)>',  # Netflix: <b>Nice-to-Have Skills:</b>
+    r'<li><p>Nice to have:',  # Netflix variant: inline in list item with <p>
+    r'<h[23]>\s*Nice to haves?:?\s*</h[23]>',  # Netflix: <h2/h3>Nice to haves:</h2/h3>
+    r'<p>Some nice to haves?</p>',  # Netflix: <p>Some nice to haves</p>
+    r'<p>Nice to have experience:?</p>',  # Netflix: <p>Nice to have experience:</p>
+    r'<p><span>Additive skill set</span></p>',  # Netflix: <p><span>Additive skill set</span></p>
+    r'<p><b>(?:<span>)?Nice To Have(?:</span>)?</b></p>',  # Netflix: <p><b><span>Nice To Have</span></b></p>
+    r'<div><strong>What Sets You Apart</strong></div>',  # Netflix: <div><strong>What Sets You Apart</strong></div>
+)
+
+# Patterns that mark end of requirements (back to description content)
+_END_REQ_PATTERNS = (
+    r'<(?:strong|b)[^>]*>\s*What (?:will you|you will) learn',
+    r'<(?:strong|b)[^>]*>\s*The (?:Summer )?Internship',
+    r'<(?:strong|b)[^>]*>\s*About (?:the|this)',
+    r'<h2[^>]*>\s*A few more things about us\s*</h2>',  # Netflix compensation section
+    r'<p>(?:<span>)?Our compensation structure',  # Netflix: compensation section starts
+    r'<p><span>Our culture is unique',  # Netflix: culture section starts
+    r'<p>\s*(?:<br\s*/?>\s*)?At Netflix, we carefully consider',  # Netflix: compensation section
+    r'<p>(?:<span>)?Read about the Netflix',  # Netflix: culture section starts
+    r'<p>(?:<span>)?Our team includes',  # Netflix: diversity section starts
+    r'<p>(?:<span>)?At Netflix, we strive to provide',  # Netflix: compensation section starts
+    r'<p>(?:<span>)?However, we are looking for more than',  # Netflix: soft skills section (not requirements)
+    r'<h2><b>(?:<b>)?Learn More(?:</b>)?</b></h2>',  # Netflix: <h2><b><b>Learn More</b></b></h2>
+    r'<div><strong>Spotlight on',  # Netflix: <div><strong>Spotlight on Content Engineering Teams:</strong></div>
+    r'<div><strong>A few more things about us',  # Netflix: <div><strong>A few more things about us:</strong></div>
+)
 
 
 class NetflixExtractor(BaseJobExtractor[TitleFilters]):
@@ -36,20 +117,27 @@ class NetflixExtractor(BaseJobExtractor[TitleFilters]):
 
     API_URL = "https://explore.jobs.netflix.net/api/apply/v2/jobs"
     URL_PREFIX_JOB = "https://jobs.netflix.com/jobs"
+    URL_BUILDER_KEY = 'url'  # canonicalPositionUrl, stored as response_data url
+
+    # Netflix-specific headers
+    DEFAULT_HEADERS = {
+        'accept': '*/*',
+        'accept-language': 'en-US,en;q=0.9',
+        'content-type': 'application/json',
+        'referer': 'https://explore.jobs.netflix.net/careers',
+        'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
+    }
+
+    # Max page requests in flight at once during pagination
+    PAGE_CONCURRENCY = 5
+
+    # Description/requirements splitter, patterns compiled once per class
+    _SPLITTER = SectionSplitter(_QUAL_PATTERNS, _NICE_TO_HAVE_PATTERNS, _END_REQ_PATTERNS)
 
     def __init__(self, config):
         """Initialize Netflix extractor"""
         super().__init__(config)
-
-    def get_headers(self) -> Dict[str, str]:
-        """Override with Netflix-specific headers"""
-        return {
-            'accept': '*/*',
-            'accept-language': 'en-US,en;q=0.9',
-            'content-type': 'application/json',
-            'referer': 'https://explore.jobs.netflix.net/careers',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
-        }
+        self._page_sem = asyncio.Semaphore(self.PAGE_CONCURRENCY)
 
     def _build_params(self, start: int, num: int) -> Dict[str, Any]:
         """
@@ -75,6 +163,49 @@ class NetflixExtractor(BaseJobExtractor[TitleFilters]):
 
         return params
 
+    async def _fetch_page(self, start: int, num: int) -> Dict[str, Any]:
+        """
+        Fetch one page of positions (bounded by _page_sem)
+
+        Args:
+            start: Starting position (0-indexed)
+            num: Number of jobs to fetch
+
+        Returns:
+            Parsed API response ({'count': int, 'positions': [...]})
+        """
+        async with self._page_sem:
+            response = await self.make_request(
+                self.API_URL,
+                params=self._build_params(start=start, num=num),
+                timeout=10.0
+            )
+        return self._parse_json(response)
+
+    def _standardize_positions(self, positions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert API positions to standardized job objects
+
+        Args:
+            positions: Position dicts from the API response
+
+        Returns:
+            List of standardized job objects
+        """
+        return [
+            {
+                'id': position.get('id'),
+                'title': position.get('name', ''),
+                'location': position.get('location', ''),
+                # Only 'url' is read downstream (it drives base class URL
+                # building), so the full API position isn't retained per job
+                'response_data': {
+                    'url': position.get('canonicalPositionUrl', ''),
+                }
+            }
+            for position in positions
+        ]
+
     async def _fetch_all_jobs(self) -> List[Dict[str, Any]]:
         """
         Fetch all jobs using pagination and return standardized job objects
@@ -82,83 +213,51 @@ class NetflixExtractor(BaseJobExtractor[TitleFilters]):
         Applies API-level filters (Teams, Work Type, Region) through hardcoded params
         and returns standardized job objects with id, title, and response_data.
 
+        The first page gives the total count; the remaining pages are then
+        fetched concurrently (PAGE_CONCURRENCY at a time) and kept in order.
+
         Returns:
             List of standardized job objects:
             {
                 'id': str,              # Job ID for URL construction
                 'title': str,           # Job title for filtering
-                'response_data': dict   # Original job data from API
+                'response_data': dict   # {'url'} from the API position
             }
         """
-        # Hardcoded batch size
+        # Hardcoded batch size: the page size the API is known to accept
+        # (requested per page; the API may return fewer)
         BATCH_SIZE = 50
 
-        all_standardized_jobs = []
-        start = 0
-
         try:
             # First call to get total count
-            params = self._build_params(start=0, num=BATCH_SIZE)
-            response = await self.make_request(
-                self.API_URL,
-                params=params,
-                timeout=10.0
-            )
-
-            data = response.json()
+            data = await self._fetch_page(start=0, num=BATCH_SIZE)
             positions = data.get('positions', [])
             total = data.get('count', 0)
 
             if not positions:
                 return []
 
-            # Process first batch
-            for position in positions:
-                # Add 'url' from canonicalPositionUrl for base class URL building
-                position['url'] = position.get('canonicalPositionUrl', '')
-                standardized_job = {
-                    'id': position.get('id'),
-                    'title': position.get('name', ''),
-                    'location': position.get('location', ''),
-                    'response_data': position
-                }
-                all_standardized_jobs.append(standardized_job)
-
-            start = len(positions)
+            all_standardized_jobs = self._standardize_positions(positions)
 
-            # Fetch remaining pages
-            while start < total:
-                params = self._build_params(start=start, num=BATCH_SIZE)
-                response = await self.make_request(
-                    self.API_URL,
-                    params=params,
-                    timeout=10.0
-                )
+            # Fetch remaining pages concurrently. Offsets step by the first page's
+            # size, so a server-side cap below BATCH_SIZE doesn't skip positions.
+            page_size = len(positions)
+            pages = await asyncio.gather(*(
+                self._fetch_page(start=start, num=BATCH_SIZE)
+                for start in range(page_size, total, page_size)
+            ))
 
-                data = response.json()
+            # Process pages in order, stopping at the first empty one
+            for data in pages:
                 positions = data.get('positions', [])
-
                 if not positions:
                     break
-
-                # Process batch
-                for position in positions:
-                    # Add 'url' from canonicalPositionUrl for base class URL building
-                    position['url'] = position.get('canonicalPositionUrl', '')
-                    standardized_job = {
-                        'id': position.get('id'),
-                        'title': position.get('name', ''),
-                        'location': position.get('location', ''),
-                        'response_data': position
-                    }
-                    all_standardized_jobs.append(standardized_job)
-
-                start += len(positions)
+                all_standardized_jobs.extend(self._standardize_positions(positions))
 
             return all_standardized_jobs
 
-        except Exception as e:
-            print(f"Error fetching Netflix jobs: {e}")
+        except Exception:
+            logger.exception("Error fetching Netflix jobs")
             return []
 
     async def crawl_raw_info(self, job_url: str) -> str:
@@ -177,20 +276,19 @@ class NetflixExtractor(BaseJobExtractor[TitleFilters]):
         Raises:
             Exception: On HTTP errors or connection failures
         """
-        import re
-
         # Convert jobs.netflix.com URL to explore.jobs.netflix.net
-        job_id_match = re.search(r'/jobs/(\d+)', job_url)
-        if job_id_match:
-            job_id = job_id_match.group(1)
-            actual_url = f"https://explore.jobs.netflix.net/careers/job/{job_id}"
+        # (https://jobs.netflix.com/jobs/<id>); anything else is fetched as-is
+        parts = job_url.rsplit('/jobs/', 1)
+        if len(parts) == 2 and parts[1].isdigit():
+            actual_url = f"https://explore.jobs.netflix.net/careers/job/{parts[1]}"
         else:
             actual_url = job_url
 
-        response = await self.make_request(
-            actual_url,
-            timeout=15.0
-        )
+        async with self._crawl_sem:
+            response = await self.make_request(
+                actual_url,
+                timeout=15.0
+            )
         return response.text
 
     def extract_raw_info(self, raw_content: str) -> dict:
@@ -211,163 +309,19 @@ class NetflixExtractor(BaseJobExtractor[TitleFilters]):
         Raises:
             ValueError: If content cannot be parsed
         """
-        import re
-        import html
-
         if not raw_content:
             raise ValueError("No content to extract from")
 
-        def strip_html(text: str) -> str:
-            """Strip HTML tags and normalize whitespace"""
-            text = re.sub(r'<br\s*/?>', '\n', text)
-            # Handle list items: <li><p>content</p></li> -> \n- content
-            text = re.sub(r'<li[^>]*>\s*<p[^>]*>', '\n- ', text)  # li+p combo
-            text = re.sub(r'</p>\s*</li>', '', text)  # Close li+p combo
-            text = re.sub(r'<li[^>]*>', '\n- ', text)  # Standalone li
-            text = re.sub(r'</li>', '', text)
-            text = re.sub(r'<p[^>]*>', '\n', text)
-            text = re.sub(r'</p>', '\n', text)
-            text = re.sub(r'<[^>]+>', ' ', text)
-            text = html.unescape(text)  # Decode &#39; etc.
-            text = re.sub(r'[ \t]+', ' ', text)
-            text = re.sub(r'\n +', '\n', text)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            text = re.sub(r'\n\n- ', '\n- ', text)  # No blank lines between list items
-            return text.strip()
-
         # Extract description from JSON-LD JobPosting
-        desc_match = re.search(r'"description":\s*"(.*?)"(?=,\s*")', raw_content, re.DOTALL)
-        if not desc_match:
+        job_posting = find_json_ld(raw_content)
+        raw_desc = job_posting.get('description') if job_posting else None
+        if not isinstance(raw_desc, str):
             raise ValueError("Could not find job description in JSON-LD")
 
-        desc_html = html.unescape(desc_match.group(1))
-
-        # Try to split into description and requirements sections
-        description_parts = []
-        requirements_parts = []
-
-        # Look for qualifications section markers
-        # Netflix uses various patterns:
-        # - <b><span>Qualifications:</span></b>
-        # - <b><span>Basic Qualifications:</span></b>
-        # - <strong>Qualifications:</strong>
-        # - <h2>Who you are</h2>
-        # - "We're Eager to Talk to You If:" (plain text in <p>)
-        qual_patterns = [
-            r'<(?:strong|b)[^>]*>\s*<span>\s*(?:Basic )?Qualifications?:?\s*</span>\s*</(?:strong|b)>',  # Netflix: <b><span>Qualifications:</span></b>
-            r'<(?:strong|b)[^>]*>\s*(?:We are looking for individuals with the following )?(?:Basic )?qualifications?:?\s*</(?:strong|b)>',
-            r'<h2[^>]*>\s*(?:Required |Basic )?Qualifications?:?\s*</h2>',
-            r'<(?:strong|b)[^>]*>\s*Requirements?:?\s*</(?:strong|b)>',
-            r'<h2[^>]*>\s*<span>\s*Who you are\s*</span>\s*</h2>',  # Netflix variant
-            r'<h2[^>]*>\s*Who you are\s*</h2>',  # Netflix variant without span
-            r"<p>We&#39;re Eager to Talk to You If:?</p>",  # Netflix variant: plain text requirement header
-            r"<p>We're Eager to Talk to You If:?</p>",  # Netflix variant: decoded
-            r'<(?:strong|b)[^>]*>Must-Have Skills\s*<span>:?</span>\s*</(?:strong|b)>',  # Netflix: <b>Must-Have Skills<span>:</span></b>
-            r'<(?:strong|b)[^>]*>Must-Have Skills:?\s*</(?:strong|b)>',  # Netflix: <b>Must-Have Skills:</b>
-            r'<h2[^>]*>\s*What we are looking for\s*</h2>',  # Netflix variant
-            r'<(?:strong|b)[^>]*>\s*What we are looking for:?\s*</(?:strong|b)>',  # Netflix: <b>What we are looking for:</b>
-            r'<(?:strong|b)[^>]*>\s*You will enjoy working with us if you:?\s*</(?:strong|b)>',  # Netflix variant
-            r"<(?:strong|b)[^>]*>\s*Skills\s*&amp;\s*experience\s+we['\u2019]re\s+seeking:?\s*</(?:strong|b)>",  # Netflix: <b>Skills & experience we're seeking:</b>
-            r'<p>(?:<br\s*/?>)?What we are looking for in you:?</p>',  # Netflix: <p>What we are looking for in you:</p>
-            r"<h[23]>\s*Skills\s*&amp;\s*experience\s+we['\u2019]re\s+seeking:?\s*</h[23]>",  # Netflix: <h2/h3>Skills & experience we're seeking:</h2/h3>
-            r'<p>What you need to have</p>',  # Netflix: <p>What you need to have</p>
-            r'<p>(?:<br\s*/?>)?Who you are:?</p>',  # Netflix: <p>Who you are:</p> or <p><br />Who you are:</p>
-            r'<p><b>(?:<span>)?What sets you apart(?:</span>)?</b></p>',  # Netflix: <p><b><span>What sets you apart</span></b></p>
-            r'<h2>(?:<span>)?About You(?:</span>)?</h2>',  # Netflix: <h2><span>About You</span></h2>
-            r'<h2>(?:<span>)?Must Have(?:</span>)?</h2>',  # Netflix: <h2><span>Must Have</span></h2>
-            r'<p>(?:<br\s*/?>)?What you need to be successful:?</p>',  # Netflix: <p>What you need to be successful:</p>
-            r'<span>We are confident you can do this job if you\.{3}</span>',  # Netflix: We are confident you can do this job if you...
-            r'<p><b>(?:<span>)?You will thrive in the role if:?(?:</span>)?</b></p>',  # Netflix: <p><b><span>You will thrive in the role if:</span></b></p>
-            r'<p><b>(?:<span>)?Desired Background:?(?:</span>)?</b></p>',  # Netflix: <p><b><span>Desired Background:</span></b></p>
-            r'<h2><b>(?:<span>)?Requirements:?(?:</span>)?</b></h2>',  # Netflix: <h2><b><span>Requirements:</span></b></h2>
-        ]
-
-        nice_to_have_patterns = [
-            r'<(?:strong|b)[^>]*>\s*<span>\s*Nice To Have:?\s*</span>\s*</(?:strong|b)>',  # Netflix: <b><span>Nice To Have:</span></b>
-            r'<(?:strong|b)[^>]*>\s*Nice to have:?\s*</(?:strong|b)>',
-            r'<(?:strong|b)[^>]*>\s*Preferred:?\s*</(?:strong|b)>',
-            r'<h2[^>]*>\s*Nice to have:?\s*</h2>',
-            r'<h2[^>]*>\s*<span>\s*What sets you apart\s*</span>\s*</h2>',  # Netflix variant
-            r'<h2[^>]*>\s*What sets you apart\s*</h2>',  # Netflix variant without span
-            r'<li>Some nice to haves:',  # Netflix variant: inline in list item
-            r'<(?:strong|b)[^>]*>Nice-to-Have Skills\s*<span>:?</span>\s*</(?:strong|b)>',  # Netflix: <b>Nice-to-Have Skills<span>:</span></b>
-            r'<(?:strong|b)[^>]*>Nice-to-Have Skills:?\s*</(?:strong|b)>',  # Netflix: <b>Nice-to-Have Skills:</b>
-            r'<li><p>Nice to have:',  # Netflix variant: inline in list item with <p>
-            r'<h[23]>\s*Nice to haves?:?\s*</h[23]>',  # Netflix: <h2/h3>Nice to haves:</h2/h3>
-            r'<p>Some nice to haves?</p>',  # Netflix: <p>Some nice to haves</p>
-            r'<p>Nice to have experience:?</p>',  # Netflix: <p>Nice to have experience:</p>
-            r'<p><span>Additive skill set</span></p>',  # Netflix: <p><span>Additive skill set</span></p>
-            r'<p><b>(?:<span>)?Nice To Have(?:</span>)?</b></p>',  # Netflix: <p><b><span>Nice To Have</span></b></p>
-            r'<div><strong>What Sets You Apart</strong></div>',  # Netflix: <div><strong>What Sets You Apart</strong></div>
-        ]
-
-        # Patterns that mark end of requirements (back to description content)
-        end_req_patterns = [
-            r'<(?:strong|b)[^>]*>\s*What (?:will you|you will) learn',
-            r'<(?:strong|b)[^>]*>\s*The (?:Summer )?Internship',
-            r'<(?:strong|b)[^>]*>\s*About (?:the|this)',
-            r'<h2[^>]*>\s*A few more things about us\s*</h2>',  # Netflix compensation section
-            r'<p>(?:<span>)?Our compensation structure',  # Netflix: compensation section starts
-            r'<p><span>Our culture is unique',  # Netflix: culture section starts
-            r'<p>\s*(?:<br\s*/?>\s*)?At Netflix, we carefully consider',  # Netflix: compensation section
-            r'<p>(?:<span>)?Read about the Netflix',  # Netflix: culture section starts
-            r'<p>(?:<span>)?Our team includes',  # Netflix: diversity section starts
-            r'<p>(?:<span>)?At Netflix, we strive to provide',  # Netflix: compensation section starts
-            r'<p>(?:<span>)?However, we are looking for more than',  # Netflix: soft skills section (not requirements)
-            r'<h2><b>(?:<b>)?Learn More(?:</b>)?</b></h2>',  # Netflix: <h2><b><b>Learn More</b></b></h2>
-            r'<div><strong>Spotlight on',  # Netflix: <div><strong>Spotlight on Content Engineering Teams:</strong></div>
-            r'<div><strong>A few more things about us',  # Netflix: <div><strong>A few more things about us:</strong></div>
-        ]
-
-        # Find the start of qualifications section
-        qual_start = None
-        for pattern in qual_patterns:
-            match = re.search(pattern, desc_html, re.IGNORECASE)
-            if match:
-                qual_start = match.start()
-                break
-
-        if qual_start:
-            # Split at qualifications
-            desc_part = desc_html[:qual_start]
-            req_part = desc_html[qual_start:]
-
-            description_parts.append(strip_html(desc_part))
-
-            # Find end of requirements section (if there's more description after)
-            req_end = len(req_part)
-            for pattern in end_req_patterns:
-                match = re.search(pattern, req_part, re.IGNORECASE)
-                if match:
-                    req_end = match.start()
-                    # Add remaining content back to description
-                    remaining = req_part[match.start():]
-                    description_parts.append(strip_html(remaining))
-                    break
-
-            req_part = req_part[:req_end]
-
-            # Check for "nice to have" within requirements
-            nice_start = None
-            for pattern in nice_to_have_patterns:
-                match = re.search(pattern, req_part, re.IGNORECASE)
-                if match:
-                    nice_start = match.start()
-                    break
+        # The description is entity-encoded HTML (&lt;p&gt;... &amp;#39;), so
+        # decode once here to get the markup; strip_html decodes the remaining
+        # text entities (&#39;) only after the tags are gone
+        desc_html = html.unescape(raw_desc)
 
-            if nice_start:
-                required_part = req_part[:nice_start]
-                preferred_part = req_part[nice_start:]
-                requirements_parts.append(f"Required:\n{strip_html(required_part)}")
-                requirements_parts.append(f"Preferred:\n{strip_html(preferred_part)}")
-            else:
-                requirements_parts.append(strip_html(req_part))
-        else:
-            # No clear requirements section - put everything in description
-            description_parts.append(strip_html(desc_html))
-
-        return {
-            'description': '\n\n'.join(description_parts),
-            'requirements': '\n\n'.join(requirements_parts),
-        }
+        return self._SPLITTER.split(desc_html)
 
@@ -25,13 +25,39 @@ Sample API Response:
 }
 """
 
-import re
 import html
+import logging
 
 from typing import List, Dict, Any
-from .base_extractor import BaseJobExtractor
+from .base_extractor import BaseJobExtractor, find_json_ld
 from .config import TitleFilters
 from .enums import Company
+from .section_splitter import SectionSplitter
+
+logger = logging.getLogger(__name__)
+
+# Section headers are <strong>/<b> tags; the marker lists below hold what
+# follows the opening tag, each in priority order (first pattern found wins)
+_HEADER_OPEN = r'<(?:strong|b)[^>]*>'
+
+# Requirements section markers
+_REQ_PATTERNS = (
+    r'\s*You might thrive in this role if[^<]*</(?:strong|b)>',
+    r'\s*We[\'\u2019]re looking for[^<]*</(?:strong|b)>',
+    r'\s*(?:We expect you to|Qualifications?|Requirements?)\s*:?\s*</(?:strong|b)>',
+    r'\s*(?:What we[\'\u2019]re looking for|About you|About You|You should have)\s*:?\s*</(?:strong|b)>',
+)
+
+# "Nice to have" markers within requirements
+_NICE_TO_HAVE_PATTERNS = (
+    r'\s*(?:Nice to have|Bonus|Preferred|Nice-to-have)\s*:?\s*</(?:strong|b)>',
+)
+
+# End of requirements (compensation/about section)
+_END_PATTERNS = (
+    r'\s*About OpenAI\s*</(?:strong|b)>',
+    r'\s*(?:Compensation|Benefits|Location|We offer|Our tech stack)\s*:?\s*</(?:strong|b)>',
+)
 
 
 class OpenAIExtractor(BaseJobExtractor[TitleFilters]):
@@ -49,17 +75,22 @@ class OpenAIExtractor(BaseJobExtractor[TitleFilters]):
 
     API_URL = "https://api.ashbyhq.com/posting-api/job-board/openai"
     URL_PREFIX_JOB = "https://jobs.ashbyhq.com/openai"
+    URL_BUILDER_KEY = 'url'  # Ashby jobUrl, stored as response_data url
+
+    # Ashby-specific headers
+    DEFAULT_HEADERS = {**BaseJobExtractor.DEFAULT_HEADERS, 'Accept': 'application/json'}
+
+    # All headers share the opening tag, so the splitter finds them in one scan;
+    # content after the requirements (compensation/about) is dropped
+    _SPLITTER = SectionSplitter(
+        _REQ_PATTERNS, _NICE_TO_HAVE_PATTERNS, _END_PATTERNS,
+        header_open=_HEADER_OPEN, keep_tail=False
+    )
 
     def __init__(self, config):
         """Initialize OpenAI extractor"""
         super().__init__(config)
 
-    def get_headers(self) -> Dict[str, str]:
-        """Override with Ashby-specific headers"""
-        headers = super().get_headers()
-        headers['Accept'] = 'application/json'
-        return headers
-
     # Hardcoded filters
     COUNTRY = 'United States'
 
@@ -78,7 +109,7 @@ class OpenAIExtractor(BaseJobExtractor[TitleFilters]):
         """
         try:
             response = await self.make_request(self.API_URL, timeout=15.0)
-            data = response.json()
+            data = self._parse_json(response)
             jobs = data.get('jobs', [])
 
             if not isinstance(jobs, list):
@@ -104,8 +135,8 @@ class OpenAIExtractor(BaseJobExtractor[TitleFilters]):
 
             return standardized_jobs
 
-        except Exception as e:
-            print(f"Error fetching OpenAI jobs: {e}")
+        except Exception:
+            logger.exception("Error fetching OpenAI jobs")
             return []
 
     def extract_raw_info(self, raw_content: str) -> dict:
@@ -127,106 +158,12 @@ class OpenAIExtractor(BaseJobExtractor[TitleFilters]):
         if not raw_content:
             raise ValueError("No content to extract from")
 
-        def strip_html(text: str) -> str:
-            """Strip HTML tags and normalize whitespace"""
-            text = re.sub(r'<br\s*/?>', '\n', text)
-            text = re.sub(r'<li[^>]*>\s*<p[^>]*>', '\n- ', text)
-            text = re.sub(r'</p>\s*</li>', '', text)
-            text = re.sub(r'<li[^>]*>', '\n- ', text)
-            text = re.sub(r'</li>', '', text)
-            text = re.sub(r'<p[^>]*>', '\n', text)
-            text = re.sub(r'</p>', '\n', text)
-            text = re.sub(r'<[^>]+>', ' ', text)
-            text = html.unescape(text)
-            text = re.sub(r'[ \t]+', ' ', text)
-            text = re.sub(r'\n +', '\n', text)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            text = re.sub(r'\n\n- ', '\n- ', text)
-            return text.strip()
-
         # Extract description from JSON-LD JobPosting
-        desc_match = re.search(
-            r'"description":\s*"(.*?)"(?=,\s*")',
-            raw_content,
-            re.DOTALL
-        )
-        if not desc_match:
+        job_posting = find_json_ld(raw_content)
+        raw_desc = job_posting.get('description') if job_posting else None
+        if not isinstance(raw_desc, str):
             raise ValueError("Could not find job description in JSON-LD")
 
-        # Unescape JSON string escapes first, then HTML entities
-        raw_desc = desc_match.group(1)
-        raw_desc = raw_desc.replace('\\"', '"').replace('\\n', '\n').replace('\\\\', '\\')
         desc_html = html.unescape(raw_desc)
 
-        description_parts = []
-        requirements_parts = []
-
-        # OpenAI/Ashby uses <strong> for section headers
-        qual_patterns = [
-            r'<(?:strong|b)[^>]*>\s*(?:About the Role|About the Team|About the role|About the team)\s*</(?:strong|b)>',
-            r'<(?:strong|b)[^>]*>\s*(?:What you\'ll do|What You\'ll Do|Responsibilities)\s*</(?:strong|b)>',
-        ]
-
-        req_patterns = [
-            r'<(?:strong|b)[^>]*>\s*You might thrive in this role if[^<]*</(?:strong|b)>',
-            r'<(?:strong|b)[^>]*>\s*We[\'\u2019]re looking for[^<]*</(?:strong|b)>',
-            r'<(?:strong|b)[^>]*>\s*(?:We expect you to|Qualifications?|Requirements?)\s*:?\s*</(?:strong|b)>',
-            r'<(?:strong|b)[^>]*>\s*(?:What we[\'\u2019]re looking for|About you|About You|You should have)\s*:?\s*</(?:strong|b)>',
-        ]
-
-        nice_to_have_patterns = [
-            r'<(?:strong|b)[^>]*>\s*(?:Nice to have|Bonus|Preferred|Nice-to-have)\s*:?\s*</(?:strong|b)>',
-        ]
-
-        end_patterns = [
-            r'<(?:strong|b)[^>]*>\s*About OpenAI\s*</(?:strong|b)>',
-            r'<(?:strong|b)[^>]*>\s*(?:Compensation|Benefits|Location|We offer|Our tech stack)\s*:?\s*</(?:strong|b)>',
-        ]
-
-        # Find start of requirements section
-        req_start = None
-        for pattern in req_patterns:
-            match = re.search(pattern, desc_html, re.IGNORECASE)
-            if match:
-                req_start = match.start()
-                break
-
-        if req_start:
-            desc_part = desc_html[:req_start]
-            req_part = desc_html[req_start:]
-
-            description_parts.append(strip_html(desc_part))
-
-            # Find end of requirements (compensation/about section)
-            req_end = len(req_part)
-            for pattern in end_patterns:
-                match = re.search(pattern, req_part, re.IGNORECASE)
-                if match:
-                    req_end = match.start()
-                    break
-
-            req_part = req_part[:req_end]
-
-            # Check for nice-to-have within requirements
-            nice_start = None
-            for pattern in nice_to_have_patterns:
-                match = re.search(pattern, req_part, re.IGNORECASE)
-                if match:
-                    nice_start = match.start()
-                    break
-
-            if nice_start:
-                required_part = req_part[:nice_start]
-                preferred_part = req_part[nice_start:]
-                requirements_parts.append(f"Required:\n{strip_html(required_part)}")
-                requirements_parts.append(f"Preferred:\n{strip_html(preferred_part)}")
-            else:
-                requirements_parts.append(strip_html(req_part))
-        else:
-            # No clear requirements section
-            description_parts.append(strip_html(desc_html))
-
-        return {
-            'description': '\n\n'.join(description_parts),
-            'requirements': '\n\n'.join(requirements_parts),
-        }
+        return self._SPLITTER.split(desc_html)
@@ -24,11 +24,126 @@ Sample API Response:
 ]
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import html
+import logging
+import re
+
+import ijson
+
 from .base_extractor import BaseJobExtractor
 from .config import TitleFilters
 from .enums import Company
 
+logger = logging.getLogger(__name__)
+
+# strip_html passes, in order; html.unescape runs between the tag and whitespace passes
+_TAG_SUBS = (
+    (re.compile(r'<br\s*/?>'), '\n'),
+    (re.compile(r'<li[^>]*>'), '\n- '),
+    (re.compile(r'</li>'), ''),
+    (re.compile(r'<p[^>]*>'), '\n'),
+    (re.compile(r'</p>'), '\n'),
+    # Any other tag. Possessive and stopping at '<': a stray '<' with no '>'
+    # fails at the next '<' instead of rescanning to the end (quadratic)
+    (re.compile(r'<[^<>]++>'), ' '),
+)
+# Space runs: '  +' starts with a literal, so the engine skips ahead between
+# matches instead of rewriting every single space between words ('[ \t]+')
+_SPACE_RUN_RE = re.compile(r'  +')
+_WS_SUBS = (
+    (re.compile(r'\n +'), '\n'),
+    (re.compile(r'\n\n\n+'), '\n\n'),  # 3+ newlines; faster than '\n{3,}'
+    (re.compile(r'\n\n- '), '\n- '),  # No blank lines between list items
+)
+
+# Job content: new rich-text div format, or old content-intro to description div.
+# Each is an opening pattern plus a literal end, found with str.find (_delimited_body)
+_RICH_TEXT_RE = re.compile(r'class="rich-text[^"]*"[^>]*>')
+_RICH_TEXT_END = '</div></div></div></section>'
+_CONTENT_RE = re.compile(r'<div class="content-intro">')
+_CONTENT_END = '<div class="description"'
+
+# Company intro (within the job content)
+_INTRO_END = '</div>'
+
+# Content between content-intro and the first section: after the first </div>
+# (and an optional <p>) up to the first "You ..." section header
+_DIV_CLOSE_RE = re.compile(r'</div>(?:<p>)?', re.IGNORECASE)
+_BETWEEN_END_RE = re.compile(r'<h2>You |<(?:p|h2)><strong>You ', re.IGNORECASE)
+
+# "You Will/Have/Are" section headers - handles <h2>, <h3>, <strong>, and <p> wrappers
+_YOU_WILL_RE = re.compile(r'(?:<h[23]>|<p>|<strong>)You Will:?(?:</h[23]>|</p>|</strong>)', re.IGNORECASE)
+_YOU_HAVE_RE = re.compile(r'(?:<h[23]>|<p>|<strong>)You Have:?\s*(?:</h[23]>|</p>|</strong>)', re.IGNORECASE)
+_YOU_ARE_RE = re.compile(r'(?:<h[23]>|<p>|<strong>)You Are:?(?:</h[23]>|</p>|</strong>)', re.IGNORECASE)
+
+# Section ends (always match: '$' is the fallback); You Are ends at any heading
+_SECTION_END_RE = re.compile(
+    r'<h[23]>You |<p>You |<(?:p|h[23])><strong>You |<div class="content-pay|$', re.IGNORECASE
+)
+_YOU_ARE_END_RE = re.compile(
+    r'<h[23]>|<p>You |<(?:p|h[23])><strong>|<div class="content-pay|$', re.IGNORECASE
+)
+
+
+def _strip_html(text: str) -> str:
+    """Strip HTML tags and normalize whitespace"""
+    for pattern, repl in _TAG_SUBS:
+        text = pattern.sub(repl, text)
+    text = html.unescape(text)  # Decode &#x27; etc.
+    text = _SPACE_RUN_RE.sub(' ', text.replace('\t', ' '))
+    for pattern, repl in _WS_SUBS:
+        text = pattern.sub(repl, text)
+    return text.strip()
+
+
+def _section_body(head_re: re.Pattern, end_re: re.Pattern, text: str) -> Optional[str]:
+    """
+    Body of the first section headed by head_re, up to the earliest end_re match
+
+    Same result as re.search(head + r'(.*?)' + end, text, re.DOTALL).group(1)
+    (end_re always matches), but each pattern is scanned for once instead of
+    retrying the end alternation at every character of the body.
+    """
+    head = head_re.search(text)
+    if not head:
+        return None
+    return text[head.end():end_re.search(text, head.end()).start()]
+
+
+def _delimited_body(head_re: re.Pattern, end: str, text: str) -> Optional[str]:
+    """
+    Text from the first head_re match up to the next occurrence of end
+
+    Same result as re.search(head + r'(.*?)' + re.escape(end), text, re.DOTALL).group(1),
+    but the body is skipped with str.find instead of trying end at every character.
+    """
+    head = head_re.search(text)
+    if not head:
+        return None
+    stop = text.find(end, head.end())
+    return None if stop < 0 else text[head.end():stop]
+
+
+def _between_body(text: str) -> Optional[str]:
+    """
+    Content between the first </div> and the first section header
+
+    Same result as re.search(r'</div>(?:<p>)?(.*?)(?:' + _BETWEEN_END_RE.pattern + ')',
+    text, re.DOTALL | re.IGNORECASE).group(1), scanning for each part once.
+    """
+    div = _DIV_CLOSE_RE.search(text)
+    if not div:
+        return None
+    end = _BETWEEN_END_RE.search(text, div.end())
+    if end:
+        return text[div.end():end.start()]
+    # Without the optional <p>, a header may start right at it (empty body)
+    after_div = div.start() + len('</div>')
+    if div.end() > after_div and _BETWEEN_END_RE.match(text, after_div):
+        return ''
+    return None
+
 
 class RobloxExtractor(BaseJobExtractor[TitleFilters]):
     """
@@ -43,16 +158,13 @@ class RobloxExtractor(BaseJobExtractor[TitleFilters]):
     API_URL = "https://d32kbl9jppd7az.cloudfront.net/careers/jobs.json"
     URL_PREFIX_JOB = "https://careers.roblox.com/jobs"
 
+    # Roblox-specific headers
+    DEFAULT_HEADERS = {**BaseJobExtractor.DEFAULT_HEADERS, 'Accept': 'application/json'}
+
     def __init__(self, config):
         """Initialize Roblox extractor"""
         super().__init__(config)
 
-    def get_headers(self) -> Dict[str, str]:
-        """Override with Roblox-specific headers"""
-        headers = super().get_headers()
-        headers['Accept'] = 'application/json'
-        return headers
-
     async def _fetch_all_jobs(self) -> List[Dict[str, Any]]:
         """
         Fetch all jobs from API and return standardized job objects
@@ -73,35 +185,33 @@ class RobloxExtractor(BaseJobExtractor[TitleFilters]):
         LOCATION = 'San Mateo, CA, United States'
 
         try:
-            response = await self.make_request(self.API_URL, timeout=10.0)
-            jobs = response.json()
-            if not isinstance(jobs, list):
-                return []
-
-            # Apply API filters and standardize structure
+            # Stream-parse the array so only matching jobs stay resident
+            parsed = ijson.sendable_list()
+            parser = ijson.items_coro(parsed, 'item', use_float=True)
             standardized_jobs = []
-            for job in jobs:
-                # Check employment type
-                if job.get('employment_type') != EMPLOYMENT_TYPE:
-                    continue
-
-                # Check location
-                if job.get('location') != LOCATION:
-                    continue
-
-                # Create standardized job object
-                standardized_job = {
-                    'id': job.get('id'),
-                    'title': job.get('title', ''),
-                    'location': job.get('location', ''),
-                    'response_data': job
-                }
-                standardized_jobs.append(standardized_job)
+
+            async with self.stream_request(self.API_URL, timeout=10.0) as response:
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    # Apply API filters (employment type, location) and standardize structure
+                    standardized_jobs.extend(
+                        {
+                            'id': job.get('id'),
+                            'title': job.get('title', ''),
+                            'location': LOCATION,  # Equal to job['location'] after filtering
+                            'response_data': job
+                        }
+                        for job in parsed
+                        if job.get('employment_type') == EMPLOYMENT_TYPE
+                        and job.get('location') == LOCATION
+                    )
+                    del parsed[:]
+            parser.close()
 
             return standardized_jobs
 
-        except Exception as e:
-            print(f"Error fetching Roblox jobs: {e}")
+        except Exception:
+            logger.exception("Error fetching Roblox jobs")
             return []
 
     def extract_raw_info(self, raw_content: str) -> dict:
@@ -125,80 +235,39 @@ class RobloxExtractor(BaseJobExtractor[TitleFilters]):
         Raises:
             ValueError: If content cannot be parsed
         """
-        import re
-        import html
-
         if not raw_content:
             raise ValueError("No content to extract from")
 
-        def strip_html(text: str) -> str:
-            """Strip HTML tags and normalize whitespace"""
-            text = re.sub(r'<br\s*/?>', '\n', text)
-            text = re.sub(r'<li[^>]*>', '\n- ', text)
-            text = re.sub(r'</li>', '', text)
-            text = re.sub(r'<p[^>]*>', '\n', text)
-            text = re.sub(r'</p>', '\n', text)
-            text = re.sub(r'<[^>]+>', ' ', text)
-            text = html.unescape(text)  # Decode &#x27; etc.
-            text = re.sub(r'[ \t]+', ' ', text)
-            text = re.sub(r'\n +', '\n', text)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            text = re.sub(r'\n\n- ', '\n- ', text)  # No blank lines between list items
-            return text.strip()
-
         # Try new format first: rich-text div with h2 sections
-        rich_text_match = re.search(
-            r'class="rich-text[^"]*"[^>]*>(.*?)</div></div></div></section>',
-            raw_content,
-            re.DOTALL
-        )
-
-        if rich_text_match:
-            job_content = rich_text_match.group(1)
-        else:
+        job_content = _delimited_body(_RICH_TEXT_RE, _RICH_TEXT_END, raw_content)
+
+        if job_content is None:
             # Fallback to old format: content-intro to description div
-            content_match = re.search(
-                r'<div class="content-intro">(.*?)<div class="description"',
-                raw_content,
-                re.DOTALL
-            )
-            if not content_match:
+            job_content = _delimited_body(_CONTENT_RE, _CONTENT_END, raw_content)
+            if job_content is None:
                 raise ValueError("Could not find job content section")
-            job_content = content_match.group(1)
 
         # Extract description parts
         description_parts = []
 
         # Get intro from content-intro div
-        intro_match = re.search(
-            r'<div class="content-intro">(.*?)</div>',
-            job_content,
-            re.DOTALL
-        )
-        if intro_match:
-            intro_text = strip_html(intro_match.group(1))
+        intro = _delimited_body(_CONTENT_RE, _INTRO_END, job_content)
+        if intro is not None:
+            intro_text = _strip_html(intro)
             if intro_text and len(intro_text) > 50:
                 description_parts.append(intro_text)
 
         # Get content between content-intro and first section (You Will/You Are/You Have)
-        between_match = re.search(
-            r'</div>(?:<p>)?(.*?)(?:<h2>You |<(?:p|h2)><strong>You )',
-            job_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        if between_match:
-            between_text = strip_html(between_match.group(1))
+        between = _between_body(job_content)
+        if between is not None:
+            between_text = _strip_html(between)
             if between_text and len(between_text) > 50:
                 description_parts.append(between_text)
 
         # You Will section (responsibilities) - handles <h2>, <h3>, <strong>, and <p> wrappers
-        you_will_match = re.search(
-            r'(?:<h[23]>|<p>|<strong>)You Will:?(?:</h[23]>|</p>|</strong>)(.*?)(?:<h[23]>You |<p>You |<(?:p|h[23])><strong>You |<div class="content-pay|$)',
-            job_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        if you_will_match:
-            you_will = strip_html(you_will_match.group(1))
+        you_will = _section_body(_YOU_WILL_RE, _SECTION_END_RE, job_content)
+        if you_will is not None:
+            you_will = _strip_html(you_will)
             if you_will:
                 description_parts.append(f"Responsibilities:\n{you_will}")
 
@@ -206,24 +275,16 @@ class RobloxExtractor(BaseJobExtractor[TitleFilters]):
         requirements_parts = []
 
         # You Have section - handles <h2>, <h3>, <strong>, and <p> wrappers
-        you_have_match = re.search(
-            r'(?:<h[23]>|<p>|<strong>)You Have:?\s*(?:</h[23]>|</p>|</strong>)(.*?)(?:<h[23]>You |<p>You |<(?:p|h[23])><strong>You |<div class="content-pay|$)',
-            job_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        if you_have_match:
-            you_have = strip_html(you_have_match.group(1))
+        you_have = _section_body(_YOU_HAVE_RE, _SECTION_END_RE, job_content)
+        if you_have is not None:
+            you_have = _strip_html(you_have)
             if you_have:
                 requirements_parts.append(f"Required:\n{you_have}")
 
         # You Are section (preferred traits) - handles <h2>, <h3>, <strong>, and <p> wrappers
-        you_are_match = re.search(
-            r'(?:<h[23]>|<p>|<strong>)You Are:?(?:</h[23]>|</p>|</strong>)(.*?)(?:<h[23]>|<p>You |<(?:p|h[23])><strong>|<div class="content-pay|$)',
-            job_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        if you_are_match:
-            you_are = strip_html(you_are_match.group(1))
+        you_are = _section_body(_YOU_ARE_RE, _YOU_ARE_END_RE, job_content)
+        if you_are is not None:
+            you_are = _strip_html(you_are)
             if you_are:
                 requirements_parts.append(f"Preferred:\n{you_are}")
 
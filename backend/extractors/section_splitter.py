@@ -0,0 +1,175 @@
+"""
+Description/requirements splitting for JSON-LD job descriptions
+
+Netflix and OpenAI job pages carry the description as HTML with section
+headers. Both split it the same way: find the requirements header, find the
+end of the requirements section, then look for a "nice to have" header in
+between. Only the header patterns (and what happens to the trailing content)
+differ, so each extractor holds one SectionSplitter built from its patterns.
+
+Usage:
+    splitter = SectionSplitter(REQ_PATTERNS, NICE_PATTERNS, END_PATTERNS)
+    result = splitter.split(desc_html)  # {'description': str, 'requirements': str}
+"""
+
+import html
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# strip_html passes, in order; html.unescape runs between the tag and whitespace passes
+_TAG_SUBS = (
+    (re.compile(r'<br\s*/?>'), '\n'),
+    # Handle list items: <li><p>content</p></li> -> \n- content
+    (re.compile(r'<li[^>]*>\s*<p[^>]*>'), '\n- '),  # li+p combo
+    (re.compile(r'</p>\s*</li>'), ''),  # Close li+p combo
+    (re.compile(r'<li[^>]*>'), '\n- '),  # Standalone li
+    (re.compile(r'</li>'), ''),
+    (re.compile(r'<p[^>]*>'), '\n'),
+    (re.compile(r'</p>'), '\n'),
+    # Any other tag. Possessive and stopping at '<': a stray '<' with no '>'
+    # fails at the next '<' instead of rescanning to the end (quadratic)
+    (re.compile(r'<[^<>]++>'), ' '),
+)
+# Space runs: '  +' starts with a literal, so the engine skips ahead between
+# matches instead of rewriting every single space between words ('[ \t]+')
+_SPACE_RUN_RE = re.compile(r'  +')
+_WS_SUBS = (
+    (re.compile(r'\n +'), '\n'),
+    (re.compile(r'\n\n\n+'), '\n\n'),  # 3+ newlines; faster than '\n{3,}'
+    (re.compile(r'\n\n- '), '\n- '),  # No blank lines between list items
+)
+
+_KINDS = ('req', 'nice', 'end')
+
+
+def strip_html(text: str) -> str:
+    """Strip HTML tags and normalize whitespace"""
+    for pattern, repl in _TAG_SUBS:
+        text = pattern.sub(repl, text)
+    text = html.unescape(text)  # Decode &#39; etc.
+    text = _SPACE_RUN_RE.sub(' ', text.replace('\t', ' '))
+    for pattern, repl in _WS_SUBS:
+        text = pattern.sub(repl, text)
+    return text.strip()
+
+
+class SectionSplitter:
+    """
+    Split description HTML into description and requirements text
+
+    Each marker list is in priority order: the first pattern found anywhere in
+    the searched range wins, and its first match is the split point.
+
+    Args:
+        req_patterns: Regexes for the start of the requirements section
+        nice_patterns: Regexes for "nice to have" headers within requirements
+        end_patterns: Regexes for the end of the requirements section
+        header_open: Regex that every marker starts with (e.g. an opening
+                     <strong>/<b> tag). When set, the markers follow it and are
+                     compiled into one alternation, so a single scan finds them
+                     all; otherwise each pattern is searched separately.
+        keep_tail: Append the content after the requirements section to the
+                   description (otherwise it is dropped)
+    """
+
+    def __init__(
+        self,
+        req_patterns: Iterable[str],
+        nice_patterns: Iterable[str],
+        end_patterns: Iterable[str],
+        header_open: Optional[str] = None,
+        keep_tail: bool = True
+    ):
+        self.keep_tail = keep_tail
+        patterns = dict(zip(_KINDS, map(tuple, (req_patterns, nice_patterns, end_patterns))))
+
+        self._section_re: Optional[re.Pattern] = None
+        self._patterns: Dict[str, Tuple[re.Pattern, ...]] = {}
+        if header_open is not None:
+            # Group names are '<kind>_<priority>'
+            self._section_re = re.compile(header_open + '(?:' + '|'.join(
+                f'(?P<{kind}_{i}>{pattern})'
+                for kind in _KINDS
+                for i, pattern in enumerate(patterns[kind])
+            ) + ')', re.IGNORECASE)
+        else:
+            self._patterns = {
+                kind: tuple(re.compile(p, re.IGNORECASE) for p in patterns[kind])
+                for kind in _KINDS
+            }
+
+    def split(self, desc_html: str) -> Dict[str, str]:
+        """
+        Split description HTML at its section headers
+
+        Args:
+            desc_html: Description HTML (entities in text may still be encoded)
+
+        Returns:
+            {'description': str, 'requirements': str}; requirements is
+            "Required:\\n...\\n\\nPreferred:\\n..." when a nice-to-have header is found
+        """
+        find = self._marker_finder(desc_html)
+        description_parts = []
+        requirements_parts = []
+
+        # Find the start of requirements section
+        req_start = find('req', 0, None)
+
+        if req_start:
+            # Split at requirements
+            description_parts.append(strip_html(desc_html[:req_start]))
+
+            # Find end of requirements section (if there's more description after)
+            req_end = find('end', req_start, None)
+            if req_end is not None and self.keep_tail:
+                # Add remaining content back to description
+                description_parts.append(strip_html(desc_html[req_end:]))
+
+            # Check for "nice to have" within requirements
+            nice_start = find('nice', req_start, req_end)
+
+            if nice_start is not None and nice_start > req_start:
+                required_part = desc_html[req_start:nice_start]
+                preferred_part = desc_html[nice_start:req_end]
+                requirements_parts.append(f"Required:\n{strip_html(required_part)}")
+                requirements_parts.append(f"Preferred:\n{strip_html(preferred_part)}")
+            else:
+                requirements_parts.append(strip_html(desc_html[req_start:req_end]))
+        else:
+            # No clear requirements section - put everything in description
+            description_parts.append(strip_html(desc_html))
+
+        return {
+            'description': '\n\n'.join(description_parts),
+            'requirements': '\n\n'.join(requirements_parts),
+        }
+
+    def _marker_finder(self, text: str) -> Callable[[str, int, Optional[int]], Optional[int]]:
+        """
+        Build find(kind, lo, hi) -> start of the highest-priority marker of that
+        kind lying within text[lo:hi], or None
+
+        Same result as searching text[lo:hi] with each pattern in priority order.
+        """
+        if self._section_re is None:
+            def find(kind: str, lo: int, hi: Optional[int]) -> Optional[int]:
+                endpos = len(text) if hi is None else hi
+                for pattern in self._patterns[kind]:
+                    match = pattern.search(text, lo, endpos)
+                    if match:
+                        return match.start()
+                return None
+            return find
+
+        # One scan collects every marker as kind -> [(priority, start, end)]
+        markers: Dict[str, List[Tuple[int, int, int]]] = {kind: [] for kind in _KINDS}
+        for match in self._section_re.finditer(text):
+            kind, _, priority = match.lastgroup.partition('_')
+            markers[kind].append((int(priority), match.start(), match.end()))
+
+        def find(kind: str, lo: int, hi: Optional[int]) -> Optional[int]:
+            found = [(priority, start) for priority, start, end in markers[kind]
+                     if start >= lo and (hi is None or end <= hi)]
+            return min(found)[1] if found else None
+        return find
@@ -37,7 +37,8 @@ async def get_sample_urls(company: str, limit: int = 5) -> None:
         print(f"Available companies: {', '.join(list_companies())}")
         return
 
-    result = await extractor.extract_source_urls_metadata()
+    async with extractor:
+        result = await extractor.extract_source_urls_metadata()
 
     if not result['included_jobs']:
         print(f"No jobs found for {company}")
@@ -65,7 +66,8 @@ async def crawl_raw_info(company: str, url: str) -> str | None:
         return None
 
     try:
-        raw_content = await extractor.crawl_raw_info(url)
+        async with extractor:
+            raw_content = await extractor.crawl_raw_info(url)
     except Exception as e:
         print(f"ERROR: {e}")
         return None
@@ -93,7 +95,8 @@ async def extract_info(company: str, url: str) -> None:
     # Step 1: Crawl
     print("Step 1: Crawling raw content...")
     try:
-        raw_content = await extractor.crawl_raw_info(url)
+        async with extractor:
+            raw_content = await extractor.crawl_raw_info(url)
     except Exception as e:
         print(f"ERROR during crawl: {e}")
         return
@@ -22,11 +22,98 @@ Sample API Response:
 }
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import asyncio
+import html
+import itertools
+import logging
+import re
+
 from .base_extractor import BaseJobExtractor
 from .config import TitleFilters
 from .enums import Company
 
+logger = logging.getLogger(__name__)
+
+# strip_html passes, in order; html.unescape runs between the tag and whitespace passes
+_TAG_SUBS = (
+    (re.compile(r'<br\s*/?>'), '\n'),
+    (re.compile(r'<li[^>]*>'), '\n- '),
+    (re.compile(r'</li>'), ''),
+    (re.compile(r'<p[^>]*>'), '\n'),
+    (re.compile(r'</p>'), '\n'),
+    (re.compile(r'<[^<>]++>'), ' '),
+)
+# Space runs: '  +' starts with a literal, so the engine skips ahead between
+# matches instead of rewriting every single space between words ('[ \t]+')
+_SPACE_RUN_RE = re.compile(r'  +')
+_WS_SUBS = (
+    (re.compile(r'\n +'), '\n'),
+    (re.compile(r'\n\n\n+'), '\n\n'),  # 3+ newlines; faster than '\n{3,}'
+    (re.compile(r'\n\n- '), '\n- '),  # No blank lines between list items
+)
+
+# Format 2 (direct HTML): <p class="text-[32px]...">Section</p><p class="tt-text...">content</p>
+_RESPONSIBILITIES_RE = re.compile(
+    r'>Responsibilities</p>\s*<p[^>]*class="[^"]*tt-text[^"]*"[^>]*>(.*?)</p>',
+    re.DOTALL | re.IGNORECASE
+)
+_QUALIFICATIONS_RE = re.compile(
+    r'>Qualifications</p>\s*<p[^>]*class="[^"]*tt-text[^"]*"[^>]*>(.*?)</p>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Format 1 (Next.js RSC): string payloads of self.__next_f.push() calls
+_NEXT_F_RE = re.compile(r'self\.__next_f\.push\(\[1,"(.*?)"\]\)', re.DOTALL)
+_UNICODE_ESCAPE_RE = re.compile(r'\\u([0-9a-fA-F]{4})')
+# First text block (Team Intro + Responsibilities), e.g. 30:T5f5,<content>
+_DESC_BLOCK_RE = re.compile(r'\d+:T[a-f0-9]+,(.*?)(?=\d+:T[a-f0-9]+,|\d+:\[|$)', re.DOTALL)
+# "Minimum Qualifications" through the preferred bullets, inline in RSC JSON
+_RSC_QUALIFICATIONS_RE = re.compile(
+    r'(Minimum Qualifications:?.*?Preferred Qualifications:?.*?)(?:"|\\}|\])',
+    re.DOTALL | re.IGNORECASE
+)
+
+
+def _strip_html(text: str) -> str:
+    """Strip HTML tags and normalize whitespace"""
+    for pattern, repl in _TAG_SUBS:
+        text = pattern.sub(repl, text)
+    text = html.unescape(text)
+    text = _SPACE_RUN_RE.sub(' ', text.replace('\t', ' '))
+    for pattern, repl in _WS_SUBS:
+        text = pattern.sub(repl, text)
+    return text.strip()
+
+
+def _location_from_city_info(city_info: Optional[Dict[str, Any]]) -> str:
+    """
+    Build location string from TikTok's nested city_info structure
+
+    Args:
+        city_info: Nested city info dict with structure:
+            {
+                "en_name": "San Jose",
+                "parent": {
+                    "en_name": "California",
+                    "parent": {
+                        "en_name": "United States of America"
+                    }
+                }
+            }
+
+    Returns:
+        Location string like "San Jose, California" (city, state only - no country)
+    """
+    if not city_info:
+        return ''
+    city = city_info.get('en_name')
+    # Skip country (depth 3) - we only want city and state
+    state = (city_info.get('parent') or {}).get('en_name')
+    if city and state:
+        return f'{city}, {state}'
+    return city or state or ''
+
 
 class TikTokExtractor(BaseJobExtractor[TitleFilters]):
     """
@@ -41,61 +128,36 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
     API_URL = "https://api.lifeattiktok.com/api/v1/public/supplier/search/job/posts"
     URL_PREFIX_JOB = "https://lifeattiktok.com/search"
 
+    # TikTok-specific headers
+    DEFAULT_HEADERS = {
+        'accept': '*/*',
+        'accept-language': 'en-US',
+        'content-type': 'application/json',
+        'origin': 'https://lifeattiktok.com',
+        'referer': 'https://lifeattiktok.com/',
+        'sec-fetch-dest': 'empty',
+        'sec-fetch-mode': 'cors',
+        'sec-fetch-site': 'same-site',
+        'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
+        'website-path': 'tiktok',
+    }
+
+    # Hardcoded search filters, shared by every page request (read-only)
+    SEARCH_FILTERS = {
+        'recruitment_id_list': ('1',),
+        'job_category_id_list': ('6704215862603155720',),
+        'subject_id_list': (),
+        'location_code_list': ('CT_157', 'CT_75', 'CT_1103355'),
+        'keyword': '',
+    }
+
+    # Max page requests in flight at once during pagination
+    PAGE_CONCURRENCY = 8
+
     def __init__(self, config):
         """Initialize TikTok extractor"""
         super().__init__(config)
-
-    def get_headers(self) -> Dict[str, str]:
-        """Override with TikTok-specific headers"""
-        return {
-            'accept': '*/*',
-            'accept-language': 'en-US',
-            'content-type': 'application/json',
-            'origin': 'https://lifeattiktok.com',
-            'referer': 'https://lifeattiktok.com/',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'same-site',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
-            'website-path': 'tiktok',
-        }
-
-    def _build_location_from_city_info(self, city_info: Dict[str, Any]) -> str:
-        """
-        Build location string from TikTok's nested city_info structure
-
-        Args:
-            city_info: Nested city info dict with structure:
-                {
-                    "en_name": "San Jose",
-                    "parent": {
-                        "en_name": "California",
-                        "parent": {
-                            "en_name": "United States of America"
-                        }
-                    }
-                }
-
-        Returns:
-            Location string like "San Jose, California" (city, state only - no country)
-        """
-        if not city_info:
-            return ''
-
-        parts = []
-
-        # City (depth 1)
-        if city_info.get('en_name'):
-            parts.append(city_info['en_name'])
-
-        # State (depth 2)
-        state = city_info.get('parent', {})
-        if state and state.get('en_name'):
-            parts.append(state['en_name'])
-
-        # Skip country (depth 3) - we only want city and state
-
-        return ', '.join(parts)
+        self._page_sem = asyncio.Semaphore(self.PAGE_CONCURRENCY)
 
     def _build_payload(self, limit: int, offset: int) -> Dict[str, Any]:
         """
@@ -106,22 +168,13 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
             offset: Starting position
 
         Returns:
-            Request payload
+            Request payload: SEARCH_FILTERS plus limit/offset
         """
-        # Hardcoded filters for TikTok
-        return {
-            'recruitment_id_list': ['1'],
-            'job_category_id_list': ['6704215862603155720'],
-            'subject_id_list': [],
-            'location_code_list': ['CT_157', 'CT_75', 'CT_1103355'],
-            'keyword': '',
-            'limit': limit,
-            'offset': offset,
-        }
+        return {**self.SEARCH_FILTERS, 'limit': limit, 'offset': offset}
 
     async def _fetch_jobs_page(self, limit: int, offset: int) -> tuple[List[Dict], int]:
         """
-        Fetch one page of jobs
+        Fetch one page of jobs (bounded by _page_sem)
 
         Args:
             limit: Number of jobs to fetch
@@ -133,31 +186,34 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
         payload = self._build_payload(limit, offset)
 
         try:
-            response = await self.make_request(
-                self.API_URL,
-                method='POST',
-                json=payload,
-                timeout=10.0
-            )
-
-            data = response.json()
-
-            if data.get('code') == 0:
-                jobs = data.get('data', {}).get('job_post_list', [])
-                total = data.get('data', {}).get('count', 0)
-                return jobs, total
-            else:
-                print(f"TikTok API error: {data.get('message')}")
+            async with self._page_sem:
+                response = await self.make_request(
+                    self.API_URL,
+                    method='POST',
+                    json=payload,
+                    timeout=10.0
+                )
+
+            data = self._parse_json(response)
+
+            if data.get('code') != 0:
+                logger.warning("TikTok API error: %s", data.get('message'))
                 return [], 0
 
-        except Exception as e:
-            print(f"Error fetching TikTok jobs: {e}")
+            page = data.get('data') or {}
+            return page.get('job_post_list') or [], page.get('count', 0)
+
+        except Exception:
+            logger.exception("Error fetching TikTok jobs")
             return [], 0
 
     async def _fetch_all_jobs(self) -> List[Dict[str, Any]]:
         """
         Fetch all jobs using pagination
 
+        The first page gives the total count; the remaining pages are then
+        fetched concurrently (PAGE_CONCURRENCY at a time) and kept in order.
+
         Returns:
             List of job objects with standardized structure:
             {
@@ -169,41 +225,33 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
         # Hardcoded batch size
         BATCH_SIZE = 100
 
-        all_jobs = []
-        offset = 0
-
         # First call to get total
         jobs, total = await self._fetch_jobs_page(limit=BATCH_SIZE, offset=0)
         if not jobs:
             return []
 
-        all_jobs.extend(jobs)
-        offset = BATCH_SIZE
-
-        # Fetch remaining pages
-        while offset < total:
-            jobs, _ = await self._fetch_jobs_page(limit=BATCH_SIZE, offset=offset)
-            if not jobs:
-                break
-            all_jobs.extend(jobs)
-            offset += BATCH_SIZE
-
-        # Convert to standardized format
-        standardized_jobs = []
-        for job in all_jobs:
-            # Build location from nested city_info structure
-            city_info = job.get('city_info', {})
-            location = self._build_location_from_city_info(city_info)
-
-            standardized_job = {
+        # Fetch remaining pages concurrently
+        pages = await asyncio.gather(*(
+            self._fetch_jobs_page(limit=BATCH_SIZE, offset=offset)
+            for offset in range(BATCH_SIZE, total, BATCH_SIZE)
+        ))
+
+        # Pages in order, stopping at the first empty one
+        page_jobs = itertools.chain(
+            [jobs], itertools.takewhile(bool, (page for page, _ in pages))
+        )
+
+        # Convert to standardized format in one pass over all pages
+        return [
+            {
                 'id': str(job.get('id', '')),
                 'title': job.get('title', ''),
-                'location': location,
+                # Build location from nested city_info structure
+                'location': _location_from_city_info(job.get('city_info')),
                 'response_data': job  # Preserve all API fields
             }
-            standardized_jobs.append(standardized_job)
-
-        return standardized_jobs
+            for job in itertools.chain.from_iterable(page_jobs)
+        ]
 
     def extract_raw_info(self, raw_content: str) -> dict:
         """
@@ -222,39 +270,12 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
         Raises:
             ValueError: If content cannot be parsed
         """
-        import re
-        import html
-
         if not raw_content:
             raise ValueError("No content to extract from")
 
-        def strip_html(text: str) -> str:
-            """Strip HTML tags and normalize whitespace"""
-            text = re.sub(r'<br\s*/?>', '\n', text)
-            text = re.sub(r'<li[^>]*>', '\n- ', text)
-            text = re.sub(r'</li>', '', text)
-            text = re.sub(r'<p[^>]*>', '\n', text)
-            text = re.sub(r'</p>', '\n', text)
-            text = re.sub(r'<[^>]+>', ' ', text)
-            text = html.unescape(text)
-            text = re.sub(r'[ \t]+', ' ', text)
-            text = re.sub(r'\n +', '\n', text)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            text = re.sub(r'\n\n- ', '\n- ', text)  # No blank lines between list items
-            return text.strip()
-
         # Try Format 2 first: Direct HTML with Tailwind classes
-        # Pattern: <p class="text-[32px]...">Section</p><p class="tt-text...">content</p>
-        responsibilities_match = re.search(
-            r'>Responsibilities</p>\s*<p[^>]*class="[^"]*tt-text[^"]*"[^>]*>(.*?)</p>',
-            raw_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        qualifications_match = re.search(
-            r'>Qualifications</p>\s*<p[^>]*class="[^"]*tt-text[^"]*"[^>]*>(.*?)</p>',
-            raw_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        responsibilities_match = _RESPONSIBILITIES_RE.search(raw_content)
+        qualifications_match = _QUALIFICATIONS_RE.search(raw_content)
 
         if responsibilities_match or qualifications_match:
             # Direct HTML format
@@ -262,10 +283,10 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
             requirements = ''
 
             if responsibilities_match:
-                description = strip_html(responsibilities_match.group(1))
+                description = _strip_html(responsibilities_match.group(1))
 
             if qualifications_match:
-                requirements = strip_html(qualifications_match.group(1))
+                requirements = _strip_html(qualifications_match.group(1))
                 # Normalize bullet points
                 requirements = requirements.replace('•', '-')
 
@@ -275,7 +296,7 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
             }
 
         # Format 1: Next.js RSC format
-        pieces = re.findall(r'self\.__next_f\.push\(\[1,"(.*?)"\]\)', raw_content, re.DOTALL)
+        pieces = _NEXT_F_RE.findall(raw_content)
         if not pieces:
             raise ValueError("Could not find job content in any supported format")
 
@@ -284,12 +305,11 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
         full = full.replace('\\\\n', '\n').replace('\\n', '\n')
         full = full.replace('\\"', '"')
         # Handle JSON unicode escapes like \u0026 -> &
-        full = re.sub(r'\\u([0-9a-fA-F]{4})', lambda m: chr(int(m.group(1), 16)), full)
+        full = _UNICODE_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)), full)
         full = html.unescape(full)
 
         # Extract description - first text block (Team Intro + Responsibilities)
-        # Format: 30:T5f5,<content>
-        desc_match = re.search(r'\d+:T[a-f0-9]+,(.*?)(?=\d+:T[a-f0-9]+,|\d+:\[|$)', full, re.DOTALL)
+        desc_match = _DESC_BLOCK_RE.search(full)
         if not desc_match:
             raise ValueError("Could not find description text block")
 
@@ -297,11 +317,7 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
 
         # Extract qualifications - inline in RSC JSON
         # Look for "Minimum Qualifications" followed by bullet points
-        qual_match = re.search(
-            r'(Minimum Qualifications:?.*?Preferred Qualifications:?.*?)(?:"|\\}|\])',
-            full,
-            re.DOTALL | re.IGNORECASE
-        )
+        qual_match = _RSC_QUALIFICATIONS_RE.search(full)
 
         requirements = ''
         if qual_match:
@@ -310,10 +326,10 @@ class TikTokExtractor(BaseJobExtractor[TitleFilters]):
             requirements = requirements.replace('\\n', '\n').replace('\\', '')
             # Normalize bullet points (• to -)
             requirements = requirements.replace('•', '-')
-            requirements = strip_html(requirements)
+            requirements = _strip_html(requirements)
 
         # Clean up description
-        description = strip_html(description)
+        description = _strip_html(description)
 
         # Format with section headers if not already present
         if requirements and not requirements.startswith('Minimum'):
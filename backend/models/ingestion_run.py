@@ -16,7 +16,7 @@ class RunStatus:
     ABORTED = "aborted"
 
     # Terminal states - run is no longer active
-    TERMINAL = [FINISHED, ERROR, ABORTED]
+    TERMINAL = frozenset({FINISHED, ERROR, ABORTED})
 
 
 class IngestionRun(Base):
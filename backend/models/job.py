@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import BigInteger, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from pgvector.sqlalchemy import Vector
@@ -70,18 +70,27 @@ class Job(Base):
     # Populated at extraction; nullable until embedded. See ADR-032.
     embedding: Mapped[list[float]] = mapped_column(Vector(EMBEDDING_DIM), nullable=True)
 
+    # Jobs are inserted in bulk (db/jobs_service.upsert_jobs*): Postgres fills
+    # both timestamps on insert, so no per-row Python default is evaluated
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc)
+        server_default=func.now()
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         onupdate=lambda: datetime.now(timezone.utc)
     )
 
+    # Mirrors the jobs migration (a2ef3e15d65e). The unique constraint backs the
+    # ON CONFLICT upsert and, by prefix, (user_id, company) lookups
+    __table_args__ = (
+        UniqueConstraint('user_id', 'company', 'external_id', name='uq_user_company_job'),
+        Index('idx_jobs_run_status', 'run_id', 'status'),  # SSE progress: WHERE run_id GROUP BY status
+    )
+
     def __repr__(self) -> str:
         return f"<Job(id={self.id}, company='{self.company}', external_id='{self.external_id}', status='{self.status}')>"
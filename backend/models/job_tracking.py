@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 from enum import Enum
-from sqlalchemy import BigInteger, Integer, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Integer, Boolean, Text, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from models import Base
@@ -105,6 +105,9 @@ class JobTracking(Base):
 
     __table_args__ = (
         # Ensure each user can only track a job once
+        UniqueConstraint('user_id', 'job_id', name='uq_user_job_tracking'),
+        Index('idx_job_tracking_user_id', 'user_id'),
+        Index('idx_job_tracking_job_id', 'job_id'),
         {"sqlite_autoincrement": True},
     )
 
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone, date, time
 from enum import Enum
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Integer, Text, DateTime, Date, Time, ForeignKey
+from sqlalchemy import Integer, Text, DateTime, Date, Time, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from models import Base
@@ -75,5 +75,10 @@ class TrackingEvent(Base):
         default=lambda: datetime.now(timezone.utc)
     )
 
+    __table_args__ = (
+        Index('idx_tracking_events_tracking_id', 'tracking_id'),
+        Index('idx_tracking_events_date', 'event_date'),  # Calendar date-range queries
+    )
+
     def __repr__(self) -> str:
         return f"<TrackingEvent(id={self.id}, tracking_id={self.tracking_id}, type='{self.event_type}', date={self.event_date})>"
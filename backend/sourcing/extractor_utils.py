@@ -64,8 +64,8 @@ async def run_extractor_async(company_name: str, title_filters: dict) -> Extract
     """
     try:
         config = TitleFilters.from_dict(title_filters)
-        extractor = get_extractor(company_name, config=config)
-        result = await extractor.extract_source_urls_metadata()
+        async with get_extractor(company_name, config=config) as extractor:
+            result = await extractor.extract_source_urls_metadata()
 
         return ExtractorResult(
             company=company_name,
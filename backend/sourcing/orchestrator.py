@@ -6,7 +6,6 @@ import asyncio
 import sys
 import os
 from typing import Dict, List
-from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
@@ -17,7 +16,11 @@ from .models import CompanyResult
 
 async def extract_company_urls(company: Company, config: TitleFilters) -> CompanyResult:
     """
-    Extract URLs for a single company (async wrapper for sync extractor)
+    Extract URLs for a single company
+
+    The extractor is opened as an async context manager, so all of its
+    requests (e.g. every page of a paginated API) share one HTTP client and
+    its pooled connections.
 
     Args:
         company: Company enum value
@@ -26,39 +29,29 @@ async def extract_company_urls(company: Company, config: TitleFilters) -> Compan
     Returns:
         CompanyResult with extraction data or error
     """
-    loop = asyncio.get_event_loop()
-
-    def _run_extraction():
-        """Run extraction in thread pool (extractors are synchronous)"""
-        try:
-            extractor = get_extractor(company, config)
-            result = extractor.extract_source_urls_metadata()
-            return CompanyResult(
-                company=company.value,
-                total_count=result['total_count'],
-                filtered_count=result['filtered_count'],
-                urls_count=result['urls_count'],
-                included_jobs=result['included_jobs'],
-                excluded_jobs=result['excluded_jobs'],
-                error=None
-            )
-        except Exception as e:
-            # Return error result instead of raising
-            return CompanyResult(
-                company=company.value,
-                total_count=0,
-                filtered_count=0,
-                urls_count=0,
-                included_jobs=[],
-                excluded_jobs=[],
-                error=str(e)
-            )
-
-    # Run blocking extraction in thread pool
-    with ThreadPoolExecutor() as executor:
-        result = await loop.run_in_executor(executor, _run_extraction)
-
-    return result
+    try:
+        async with get_extractor(company, config) as extractor:
+            result = await extractor.extract_source_urls_metadata()
+        return CompanyResult(
+            company=company.value,
+            total_count=result['total_count'],
+            filtered_count=result['filtered_count'],
+            urls_count=result['urls_count'],
+            included_jobs=result['included_jobs'],
+            excluded_jobs=result['excluded_jobs'],
+            error=None
+        )
+    except Exception as e:
+        # Return error result instead of raising
+        return CompanyResult(
+            company=company.value,
+            total_count=0,
+            filtered_count=0,
+            urls_count=0,
+            included_jobs=[],
+            excluded_jobs=[],
+            error=str(e)
+        )
 
 
 async def extract_all_companies(settings: Dict[Company, TitleFilters]) -> List[CompanyResult]:
@@ -164,6 +164,20 @@ class TestComputeSimhash:
         h = compute_simhash("hello")
         assert h != 0
 
+    def test_matches_per_token_bit_vote(self):
+        """Stored hashes must not change: same result as voting every token's 64 bits."""
+        for content in (SAMPLE_HTML_1, SAMPLE_HTML_DIFFERENT, "go go go rust", "a b"):
+            v = [0] * 64
+            for token in _tokenize(content):
+                token_hash = _hash_token(token)
+                for i in range(64):
+                    v[i] += 1 if token_hash & (1 << i) else -1
+            expected = sum(1 << i for i in range(64) if v[i] > 0)
+            if expected >= (1 << 63):
+                expected -= (1 << 64)
+
+            assert compute_simhash(content) == expected
+
 
 class TestHammingDistance:
     """Tests for hamming_distance function."""
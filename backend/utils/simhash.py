@@ -20,8 +20,12 @@ Usage:
 
 import hashlib
 import re
+from collections import Counter
 from typing import Optional
 
+# Word tokens; same matches as r'\b\w+\b' (a greedy \w+ run always sits on boundaries)
+_TOKEN_RE = re.compile(r'\w+')
+
 
 def _tokenize(text: str) -> list[str]:
     """
@@ -31,7 +35,7 @@ def _tokenize(text: str) -> list[str]:
     well for HTML content where we want to detect meaningful text changes.
     """
     # Extract alphanumeric tokens (words), lowercase
-    tokens = re.findall(r'\b\w+\b', text.lower())
+    tokens = _TOKEN_RE.findall(text.lower())
     return tokens
 
 
@@ -70,24 +74,31 @@ def compute_simhash(content: str) -> int:
     if not tokens:
         return 0
 
-    # Vector of 64 counters, one per bit position
-    v = [0] * 64
-
-    for token in tokens:
-        token_hash = _hash_token(token)
-
-        # For each bit position
-        for i in range(64):
-            # Check if bit i is set
-            if token_hash & (1 << i):
-                v[i] += 1
-            else:
-                v[i] -= 1
+    # Counter v[i] = (tokens with bit i set) - (tokens without) = 2 * ones[i] - total.
+    # Each distinct token is hashed once, weighted by its count, and bit counts
+    # are tallied per (byte position, byte value) pair instead of per token bit.
+    total = len(tokens)
+    byte_tallies = [[0] * 256 for _ in range(8)]  # [byte position][byte value] -> tokens
+    for token, count in Counter(tokens).items():
+        token_hash = _hash_token(token).to_bytes(8, byteorder='big')
+        for position, tally in enumerate(byte_tallies):
+            tally[token_hash[position]] += count
+
+    # ones[i] = number of tokens whose hash has bit i set (bit 0 = least significant)
+    ones = [0] * 64
+    for position, tally in enumerate(byte_tallies):
+        low_bit = (7 - position) * 8
+        for byte, count in enumerate(tally):
+            if not count:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    ones[low_bit + bit] += count
 
     # Build final hash: bit is 1 if counter > 0
     simhash = 0
     for i in range(64):
-        if v[i] > 0:
+        if 2 * ones[i] > total:
             simhash |= (1 << i)
 
     # Convert to signed 64-bit for PostgreSQL BIGINT compatibility
@@ -230,17 +230,17 @@ async def crawl_with_retry(
     Raises:
         Exception: If all retries fail
     """
-    extractor = get_extractor(company, config=TitleFilters())
     last_error = None
 
-    for attempt in range(max_retries):
-        try:
-            content = await extractor.crawl_raw_info(url)
-            return content
-        except Exception as e:
-            last_error = e
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+    async with get_extractor(company, config=TitleFilters()) as extractor:
+        for attempt in range(max_retries):
+            try:
+                content = await extractor.crawl_raw_info(url)
+                return content
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    time.sleep(retry_delay)
 
     raise last_error or Exception("Crawl failed with no error details")
 